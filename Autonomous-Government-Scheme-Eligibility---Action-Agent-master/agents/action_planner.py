@@ -2,11 +2,16 @@
 Action Planner Agent
 Creates detailed, step-by-step action plans for scheme applications
 """
+import asyncio
 import json
-from typing import Dict, Any, List, Optional
+from itertools import chain
+import orjson
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
-from pydantic import BaseModel, Field
+from types import MappingProxyType
 from loguru import logger
 
 from agents.base_agent import BaseAgent
@@ -29,8 +34,173 @@ class ActionStatus(str, Enum):
     OPTIONAL = "optional"
 
 
-class ActionStep(BaseModel):
-    """Individual action step in the application plan"""
+# Per-document lookups are pure functions over a small set of document names,
+# so they are memoized at module level instead of re-building dicts per call.
+# They return tuples (hashable, safe to share across cache hits); call sites
+# convert to lists where a mutable field is needed.
+
+_HIGH_PRIORITY_DOCS = frozenset({"aadhaar_card", "voter_id", "income_certificate", "caste_certificate"})
+_MEDIUM_PRIORITY_DOCS = frozenset({"bank_account", "domicile_certificate", "ration_card"})
+
+
+@lru_cache(maxsize=512)
+def _doc_priority(document: str) -> ActionPriority:
+    """Determine priority level for a document (cached)"""
+    if document in _HIGH_PRIORITY_DOCS:
+        return ActionPriority.CRITICAL
+    elif document in _MEDIUM_PRIORITY_DOCS:
+        return ActionPriority.HIGH
+    else:
+        return ActionPriority.MEDIUM
+
+
+_DOC_COSTS = MappingProxyType({
+    "aadhaar_card": 0.0,  # Free
+    "voter_id": 0.0,      # Free
+    "income_certificate": 50.0,
+    "caste_certificate": 100.0,
+    "domicile_certificate": 50.0,
+    "bank_account": 0.0,  # Usually free
+    "ration_card": 30.0
+})
+_DEFAULT_DOC_COST = 25.0
+
+_DOC_OFFLINE_LOCATIONS = MappingProxyType({
+    "aadhaar_card": ("Post Office", "Bank branches", "CSC centers"),
+    "income_certificate": ("Tehsildar Office", "SDM Office", "District Collectorate"),
+    "caste_certificate": ("Tehsildar Office", "SDM Office"),
+    "voter_id": ("Election Office", "Collector Office"),
+    "bank_account": ("Nearest bank branch", "Post office")
+})
+_DEFAULT_OFFLINE_LOCATIONS = ("District Collectorate", "Local government office")
+
+_DOC_TIPS = MappingProxyType({
+    "aadhaar_card": (
+        "Enrollment is free, don't pay touts",
+        "Carry multiple address proofs",
+        "Update mobile number for OTP"
+    ),
+    "income_certificate": (
+        "Apply early as it takes time",
+        "Get employer certificate for salaried persons",
+        "Keep income tax returns ready"
+    ),
+    "caste_certificate": (
+        "Original caste certificate of parent required",
+        "Ensure proper attestation",
+        "Check validity period"
+    )
+})
+_DEFAULT_DOC_TIPS = ("Carry all required documents", "Apply in person", "Keep photocopies")
+
+_DOC_MISTAKES = MappingProxyType({
+    "aadhaar_card": (
+        "Not updating address after moving",
+        "Providing wrong mobile number",
+        "Not keeping enrollment ID safe"
+    ),
+    "income_certificate": (
+        "Applying too close to deadline",
+        "Inconsistent income declarations",
+        "Missing employer signature"
+    )
+})
+_DEFAULT_DOC_MISTAKES = ("Incomplete application", "Missing signatures", "Unclear photocopies")
+
+
+@lru_cache(maxsize=512)
+def _doc_cost(document: str) -> float:
+    """Estimate cost for obtaining a document (cached)"""
+    return _DOC_COSTS.get(document, _DEFAULT_DOC_COST)
+
+
+@lru_cache(maxsize=512)
+def _doc_offline_locations(document: str) -> Tuple[str, ...]:
+    """Get offline locations for document procurement (cached)"""
+    return _DOC_OFFLINE_LOCATIONS.get(document, _DEFAULT_OFFLINE_LOCATIONS)
+
+
+@lru_cache(maxsize=512)
+def _doc_tips(document: str) -> Tuple[str, ...]:
+    """Get helpful tips for document procurement (cached)"""
+    return _DOC_TIPS.get(document, _DEFAULT_DOC_TIPS)
+
+
+@lru_cache(maxsize=512)
+def _doc_mistakes(document: str) -> Tuple[str, ...]:
+    """Get common mistakes to avoid (cached)"""
+    return _DOC_MISTAKES.get(document, _DEFAULT_DOC_MISTAKES)
+
+
+@lru_cache(maxsize=512)
+def _compute_readiness(required_docs: Tuple[str, ...], available_docs: Tuple[str, ...], eligibility_status: str) -> float:
+    """Compute user readiness score (cached on hashable document tuples)"""
+    doc_readiness = len(available_docs) / max(len(required_docs), 1) if required_docs else 1.0
+    return doc_readiness * 0.7 + (1.0 if eligibility_status == "eligible" else 0.3) * 0.3
+
+
+# Shared step templates are identical for every agent instance, so they live
+# at module level behind MappingProxyType to prevent accidental mutation.
+
+DOCUMENT_STEP_TEMPLATES = MappingProxyType({
+    "aadhaar_card": {
+        "title": "Obtain Aadhaar Card",
+        "description": "Get or update your Aadhaar card",
+        "category": "document",
+        "estimated_time": "1-2 weeks",
+        "online_resources": ["https://uidai.gov.in"],
+        "instructions": [
+            "Visit nearest Aadhaar enrollment center",
+            "Carry required documents (birth certificate, address proof)",
+            "Complete biometric enrollment",
+            "Collect acknowledgment receipt",
+            "Download Aadhaar after 90 days"
+        ]
+    },
+    "income_certificate": {
+        "title": "Obtain Income Certificate",
+        "description": "Get official income certificate from competent authority",
+        "category": "document",
+        "estimated_time": "1-2 weeks",
+        "instructions": [
+            "Visit Tehsildar/SDM office",
+            "Submit application with required documents",
+            "Pay prescribed fees",
+            "Collect certificate after verification"
+        ]
+    }
+})
+
+APPLICATION_TEMPLATES = MappingProxyType({
+    "online_portal": {
+        "title": "Submit Online Application",
+        "instructions": [
+            "Register on official portal",
+            "Fill application form carefully",
+            "Upload required documents",
+            "Pay application fees if any",
+            "Submit and save application number"
+        ]
+    },
+    "offline_submission": {
+        "title": "Submit Physical Application",
+        "instructions": [
+            "Download and fill application form",
+            "Attach required document copies",
+            "Visit designated office during working hours",
+            "Submit form and collect receipt"
+        ]
+    }
+})
+
+
+@dataclass(slots=True, kw_only=True)
+class ActionStep:
+    """Individual action step in the application plan.
+
+    Steps are built internally (never parsed from untrusted input), so a
+    slotted dataclass avoids per-field validation overhead on construction.
+    """
     step_id: str
     title: str
     description: str
@@ -40,18 +210,18 @@ class ActionStep(BaseModel):
     estimated_cost: float = 0.0
     
     # Dependencies and sequencing
-    depends_on: List[str] = Field(default_factory=list)  # Other step IDs
+    depends_on: List[str] = field(default_factory=list)  # Other step IDs
     can_parallel: bool = True  # Can be done in parallel with other steps
     
     # Detailed instructions
-    detailed_instructions: List[str] = Field(default_factory=list)
-    required_documents: List[str] = Field(default_factory=list)
-    online_resources: List[str] = Field(default_factory=list)
-    offline_locations: List[str] = Field(default_factory=list)
+    detailed_instructions: List[str] = field(default_factory=list)
+    required_documents: List[str] = field(default_factory=list)
+    online_resources: List[str] = field(default_factory=list)
+    offline_locations: List[str] = field(default_factory=list)
     
     # Contact information
-    helpline_numbers: List[str] = Field(default_factory=list)
-    email_contacts: List[str] = Field(default_factory=list)
+    helpline_numbers: List[str] = field(default_factory=list)
+    email_contacts: List[str] = field(default_factory=list)
     
     # Timing and deadlines
     suggested_start_date: Optional[str] = None
@@ -63,12 +233,13 @@ class ActionStep(BaseModel):
     completion_notes: str = ""
     
     # Tips and warnings
-    helpful_tips: List[str] = Field(default_factory=list)
-    common_mistakes: List[str] = Field(default_factory=list)
-    fallback_options: List[str] = Field(default_factory=list)
+    helpful_tips: List[str] = field(default_factory=list)
+    common_mistakes: List[str] = field(default_factory=list)
+    fallback_options: List[str] = field(default_factory=list)
 
 
-class ActionPlan(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ActionPlan:
     """Complete action plan for scheme application"""
     plan_id: str
     scheme_id: str
@@ -79,30 +250,30 @@ class ActionPlan(BaseModel):
     total_steps: int
     estimated_total_time: str
     estimated_total_cost: float
-    success_probability: float = Field(ge=0.0, le=1.0)
+    success_probability: float = 0.0
     
     # Steps categorized
-    critical_steps: List[ActionStep] = Field(default_factory=list)
-    high_priority_steps: List[ActionStep] = Field(default_factory=list) 
-    medium_priority_steps: List[ActionStep] = Field(default_factory=list)
-    optional_steps: List[ActionStep] = Field(default_factory=list)
+    critical_steps: List[ActionStep] = field(default_factory=list)
+    high_priority_steps: List[ActionStep] = field(default_factory=list) 
+    medium_priority_steps: List[ActionStep] = field(default_factory=list)
+    optional_steps: List[ActionStep] = field(default_factory=list)
     
     # Timeline
     suggested_timeline: str
-    key_milestones: List[Dict[str, str]] = Field(default_factory=list)
+    key_milestones: List[Dict[str, str]] = field(default_factory=list)
     
     # Preparation phase
-    preparation_checklist: List[str] = Field(default_factory=list)
+    preparation_checklist: List[str] = field(default_factory=list)
     
     # Risk assessment
-    potential_challenges: List[str] = Field(default_factory=list)
-    mitigation_strategies: List[str] = Field(default_factory=list)
+    potential_challenges: List[str] = field(default_factory=list)
+    mitigation_strategies: List[str] = field(default_factory=list)
     
     # Success factors
-    success_tips: List[str] = Field(default_factory=list)
+    success_tips: List[str] = field(default_factory=list)
     
     # Follow-up actions
-    post_application_steps: List[ActionStep] = Field(default_factory=list)
+    post_application_steps: List[ActionStep] = field(default_factory=list)
     
     # Metadata
     created_date: str
@@ -127,62 +298,20 @@ class ActionPlannerAgent(BaseAgent):
                 "identify_dependencies"
             ]
         )
-        
-        # Step templates for common document types
-        self.document_step_templates = {
-            "aadhaar_card": {
-                "title": "Obtain Aadhaar Card",
-                "description": "Get or update your Aadhaar card",
-                "category": "document",
-                "estimated_time": "1-2 weeks",
-                "online_resources": ["https://uidai.gov.in"],
-                "instructions": [
-                    "Visit nearest Aadhaar enrollment center",
-                    "Carry required documents (birth certificate, address proof)",
-                    "Complete biometric enrollment",
-                    "Collect acknowledgment receipt",
-                    "Download Aadhaar after 90 days"
-                ]
-            },
-            "income_certificate": {
-                "title": "Obtain Income Certificate", 
-                "description": "Get official income certificate from competent authority",
-                "category": "document",
-                "estimated_time": "1-2 weeks",
-                "instructions": [
-                    "Visit Tehsildar/SDM office",
-                    "Submit application with required documents",
-                    "Pay prescribed fees",
-                    "Collect certificate after verification"
-                ]
-            }
-        }
-        
-        # Common application processes
-        self.application_templates = {
-            "online_portal": {
-                "title": "Submit Online Application",
-                "instructions": [
-                    "Register on official portal",
-                    "Fill application form carefully",
-                    "Upload required documents",
-                    "Pay application fees if any",
-                    "Submit and save application number"
-                ]
-            },
-            "offline_submission": {
-                "title": "Submit Physical Application",
-                "instructions": [
-                    "Download and fill application form",
-                    "Attach required document copies",
-                    "Visit designated office during working hours",
-                    "Submit form and collect receipt"
-                ]
-            }
-        }
+
+        # Rendered once; self.name is immutable after construction
+        self._system_prompt = self._render_system_prompt()
+
+        # Shared, read-only templates (module-level constants)
+        self.document_step_templates = DOCUMENT_STEP_TEMPLATES
+        self.application_templates = APPLICATION_TEMPLATES
     
     def get_system_prompt(self) -> str:
         """Get system prompt for action planning"""
+        return self._system_prompt
+
+    def _render_system_prompt(self) -> str:
+        """Render the system prompt once; self.name never changes after __init__"""
         return f"""You are the {self.name}, an expert AI agent specialized in creating detailed, actionable plans for Indian government scheme applications.
 
 Your core responsibilities:
@@ -233,41 +362,47 @@ You should create comprehensive yet practical plans that empower users to succes
                     "action_plan": None
                 }
             
-            logger.info(f"Creating action plan for scheme: {scheme_details.get('name', 'Unknown')}")
+            logger.info("Creating action plan for scheme: {}", scheme_details.get("name", "Unknown"))
             
             # Step 1: Analyze current situation and requirements
             situation_analysis = await self._analyze_current_situation(
                 user_profile, scheme_details, eligibility_assessment
             )
-            
-            # Step 2: Generate document preparation steps
-            document_steps = await self._generate_document_steps(
-                scheme_details, user_profile, eligibility_assessment
-            )
-            
-            # Step 3: Generate application process steps  
-            application_steps = await self._generate_application_steps(
-                scheme_details, situation_analysis
-            )
-            
-            # Step 4: Generate verification and follow-up steps
-            followup_steps = await self._generate_followup_steps(
-                scheme_details, situation_analysis
+
+            # Steps 2-4: The three step generators are independent of each
+            # other (they only read the situation analysis), so run them
+            # concurrently instead of awaiting them one by one.
+            document_steps, application_steps, followup_steps = await asyncio.gather(
+                self._generate_document_steps(
+                    scheme_details, user_profile, eligibility_assessment
+                ),
+                self._generate_application_steps(scheme_details, situation_analysis),
+                self._generate_followup_steps(scheme_details, situation_analysis)
             )
-            
+
             # Step 5: Create comprehensive plan with LLM enhancement
             enhanced_plan = await self._create_comprehensive_plan(
-                scheme_details, document_steps, application_steps, followup_steps, situation_analysis
+                scheme_details, document_steps, application_steps, followup_steps,
+                situation_analysis, planning_options
             )
             
+            # Callers that re-serialize the plan anyway can request raw JSON,
+            # skipping the intermediate asdict() walk over the object graph.
+            if planning_options.get("response_format") == "json":
+                return {
+                    "success": True,
+                    "action_plan_json": orjson.dumps(enhanced_plan),
+                    "summary": self._generate_plan_summary(enhanced_plan)
+                }
+
             return {
                 "success": True,
-                "action_plan": enhanced_plan.dict(),
+                "action_plan": asdict(enhanced_plan),
                 "summary": self._generate_plan_summary(enhanced_plan)
             }
             
         except Exception as e:
-            logger.error(f"Error in action planning: {e}")
+            logger.error("Error in action planning: {}", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -286,9 +421,10 @@ You should create comprehensive yet practical plans that empower users to succes
         required_docs = scheme.get("documents_required", [])
         application_process = scheme.get("application_process", "unknown")
         
-        # Calculate readiness score
-        doc_readiness = len(available_docs) / max(len(required_docs), 1) if required_docs else 1.0
-        overall_readiness = doc_readiness * 0.7 + (1.0 if eligibility_status == "eligible" else 0.3) * 0.3
+        # Calculate readiness score (memoized on the hashable document tuples)
+        overall_readiness = _compute_readiness(
+            tuple(required_docs), tuple(available_docs), eligibility_status
+        )
         
         return {
             "user_readiness_score": overall_readiness,
@@ -298,6 +434,7 @@ You should create comprehensive yet practical plans that empower users to succes
             "eligibility_status": eligibility_status,
             "scheme_complexity": len(required_docs),
             "application_method": application_process,
+            "official_website": scheme.get("official_website", ""),
             "estimated_preparation_weeks": max(1, len(missing_docs) // 2),
             "user_location_type": profile.get("rural_urban", "unknown")
         }
@@ -305,18 +442,24 @@ You should create comprehensive yet practical plans that empower users to succes
     async def _generate_document_steps(self, scheme: Dict[str, Any], profile: Dict[str, Any], assessment: Dict[str, Any]) -> List[ActionStep]:
         """Generate steps for document preparation"""
         steps = []
-        step_counter = 1
-        
+        doc_ids = []  # IDs generated so far, reused for the verify step's depends_on
+
         required_docs = scheme.get("documents_required", [])
-        available_docs = profile.get("available_documents", [])
-        missing_docs = [doc for doc in required_docs if doc not in available_docs]
-        
+        available_set = set(profile.get("available_documents", []))
+        # Set membership keeps this O(required + available) while preserving
+        # the required-document ordering for step numbering
+        missing_docs = [doc for doc in required_docs if doc not in available_set]
+
+        today = datetime.now().strftime("%Y-%m-%d")
+
         # Create steps for missing documents
         for doc in missing_docs:
             template = self.document_step_templates.get(doc, {})
-            
+
+            step_id = f"doc_{len(doc_ids) + 1:02d}"
+            doc_ids.append(step_id)
             step = ActionStep(
-                step_id=f"doc_{step_counter:02d}",
+                step_id=step_id,
                 title=template.get("title", f"Obtain {doc.replace('_', ' ').title()}"),
                 description=template.get("description", f"Obtain required document: {doc.replace('_', ' ').title()}"),
                 category="document",
@@ -328,16 +471,15 @@ You should create comprehensive yet practical plans that empower users to succes
                 offline_locations=self._get_offline_locations_for_doc(doc, profile),
                 helpful_tips=self._get_document_tips(doc),
                 common_mistakes=self._get_common_mistakes(doc),
-                suggested_start_date=datetime.now().strftime("%Y-%m-%d")
+                suggested_start_date=today
             )
-            
+
             steps.append(step)
-            step_counter += 1
-        
+
         # Add document verification step if there are any documents to prepare
         if missing_docs:
             verify_step = ActionStep(
-                step_id=f"doc_{step_counter:02d}",
+                step_id=f"doc_{len(doc_ids) + 1:02d}",
                 title="Verify All Documents",
                 description="Ensure all documents are complete and valid",
                 category="verification",
@@ -349,7 +491,7 @@ You should create comprehensive yet practical plans that empower users to succes
                     "Get photocopies attested if required",
                     "Organize documents in application sequence"
                 ],
-                depends_on=[f"doc_{i:02d}" for i in range(1, step_counter)]
+                depends_on=list(doc_ids)
             )
             steps.append(verify_step)
         
@@ -375,7 +517,7 @@ You should create comprehensive yet practical plans that empower users to succes
                 "Ensure all mandatory fields are completed",
                 "Double-check all information for accuracy"
             ],
-            online_resources=[scheme.get("official_website", "")],
+            online_resources=[situation.get("official_website", "")],
             helpful_tips=[
                 "Use block letters for handwritten forms",
                 "Keep a copy of filled form for records",
@@ -460,7 +602,7 @@ You should create comprehensive yet practical plans that empower users to succes
                 "Keep application number and receipts handy"
             ],
             suggested_start_date=(datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d"),
-            online_resources=[scheme.get("official_website", "")],
+            online_resources=[situation.get("official_website", "")],
             helpful_tips=[
                 "Check status every 2-3 days",
                 "Set reminders to follow up",
@@ -518,44 +660,61 @@ You should create comprehensive yet practical plans that empower users to succes
         
         return steps
     
-    async def _create_comprehensive_plan(self, scheme: Dict[str, Any], doc_steps: List[ActionStep], app_steps: List[ActionStep], follow_steps: List[ActionStep], situation: Dict[str, Any]) -> ActionPlan:
+    async def _create_comprehensive_plan(self, scheme: Dict[str, Any], doc_steps: List[ActionStep], app_steps: List[ActionStep], follow_steps: List[ActionStep], situation: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> ActionPlan:
         """Create comprehensive action plan with LLM enhancement"""
         
-        all_steps = doc_steps + app_steps + follow_steps
-        
-        # Categorize steps by priority
-        critical_steps = [s for s in all_steps if s.priority == ActionPriority.CRITICAL]
-        high_steps = [s for s in all_steps if s.priority == ActionPriority.HIGH]
-        medium_steps = [s for s in all_steps if s.priority == ActionPriority.MEDIUM]
-        optional_steps = [s for s in all_steps if s.priority == ActionPriority.LOW or s.status == ActionStatus.OPTIONAL]
-        
+        step_groups = (doc_steps, app_steps, follow_steps)
+        total_steps = sum(map(len, step_groups))
+
+        # Bucket steps by priority and accumulate cost in a single pass,
+        # chaining the per-category lists instead of concatenating them
+        critical_steps, high_steps, medium_steps, optional_steps = [], [], [], []
+        bucket = {
+            ActionPriority.CRITICAL: critical_steps,
+            ActionPriority.HIGH: high_steps,
+            ActionPriority.MEDIUM: medium_steps,
+            ActionPriority.LOW: optional_steps
+        }
+        total_cost = 0.0
+        for step in chain.from_iterable(step_groups):
+            total_cost += step.estimated_cost
+            if step.status == ActionStatus.OPTIONAL:
+                optional_steps.append(step)
+            else:
+                bucket[step.priority].append(step)
+
         # Calculate estimates
         total_time_weeks = situation.get("estimated_preparation_weeks", 2) + 4  # +4 for processing
-        total_cost = sum(step.estimated_cost for step in all_steps)
         success_prob = min(0.9, situation.get("user_readiness_score", 0.5) + 0.3)
         
-        # Generate enhanced plan using LLM
-        enhancement_prompt = self._create_plan_enhancement_prompt(scheme, all_steps, situation)
-        
-        llm_response = await self.generate_llm_response(
-            prompt=enhancement_prompt,
-            structured=True,
-            temperature=0.4
-        )
-        
-        # Extract LLM enhancements
-        if llm_response["success"] and llm_response.get("is_structured"):
-            enhancements = llm_response["structured_data"]
+        # Generate enhanced plan using LLM unless the caller disabled it,
+        # in which case skip the round trip entirely
+        if options is None or options.get("use_llm_enhancement", True):
+            enhancement_prompt = self._create_plan_enhancement_prompt(scheme, total_steps, situation)
+
+            llm_response = await self.generate_llm_response(
+                prompt=enhancement_prompt,
+                structured=True,
+                temperature=0.4
+            )
+
+            # Extract LLM enhancements
+            if llm_response["success"] and llm_response.get("is_structured"):
+                enhancements = llm_response["structured_data"]
+            else:
+                enhancements = self._create_default_enhancements(scheme, situation)
         else:
             enhancements = self._create_default_enhancements(scheme, situation)
         
         # Create final plan
+        now = datetime.now()
+        now_iso = now.isoformat()
         plan = ActionPlan(
-            plan_id=f"plan_{scheme['scheme_id']}_{datetime.now().strftime('%Y%m%d_%H%M')}",
+            plan_id=f"plan_{scheme['scheme_id']}_{now.strftime('%Y%m%d_%H%M')}",
             scheme_id=scheme["scheme_id"],
             scheme_name=scheme["name"],
             
-            total_steps=len(all_steps),
+            total_steps=total_steps,
             estimated_total_time=f"{total_time_weeks} weeks",
             estimated_total_cost=total_cost,
             success_probability=success_prob,
@@ -575,85 +734,32 @@ You should create comprehensive yet practical plans that empower users to succes
             
             post_application_steps=follow_steps,
             
-            created_date=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat()
+            created_date=now_iso,
+            last_updated=now_iso
         )
         
         return plan
     
     def _determine_document_priority(self, document: str) -> ActionPriority:
         """Determine priority level for a document"""
-        high_priority_docs = ["aadhaar_card", "voter_id", "income_certificate", "caste_certificate"]
-        medium_priority_docs = ["bank_account", "domicile_certificate", "ration_card"]
-        
-        if document in high_priority_docs:
-            return ActionPriority.CRITICAL
-        elif document in medium_priority_docs:
-            return ActionPriority.HIGH
-        else:
-            return ActionPriority.MEDIUM
-    
+        return _doc_priority(document)
+
     def _estimate_document_cost(self, document: str) -> float:
         """Estimate cost for obtaining a document"""
-        costs = {
-            "aadhaar_card": 0.0,  # Free
-            "voter_id": 0.0,      # Free
-            "income_certificate": 50.0,
-            "caste_certificate": 100.0,
-            "domicile_certificate": 50.0,
-            "bank_account": 0.0,  # Usually free
-            "ration_card": 30.0
-        }
-        return costs.get(document, 25.0)  # Default cost
-    
+        return _doc_cost(document)
+
     def _get_offline_locations_for_doc(self, document: str, profile: Dict[str, Any]) -> List[str]:
         """Get offline locations for document procurement"""
-        locations = {
-            "aadhaar_card": ["Post Office", "Bank branches", "CSC centers"],
-            "income_certificate": ["Tehsildar Office", "SDM Office", "District Collectorate"],
-            "caste_certificate": ["Tehsildar Office", "SDM Office"],
-            "voter_id": ["Election Office", "Collector Office"],
-            "bank_account": ["Nearest bank branch", "Post office"]
-        }
-        return locations.get(document, ["District Collectorate", "Local government office"])
-    
+        return list(_doc_offline_locations(document))
+
     def _get_document_tips(self, document: str) -> List[str]:
         """Get helpful tips for document procurement"""
-        tips = {
-            "aadhaar_card": [
-                "Enrollment is free, don't pay touts",
-                "Carry multiple address proofs",
-                "Update mobile number for OTP"
-            ],
-            "income_certificate": [
-                "Apply early as it takes time",
-                "Get employer certificate for salaried persons",
-                "Keep income tax returns ready"
-            ],
-            "caste_certificate": [
-                "Original caste certificate of parent required",
-                "Ensure proper attestation",
-                "Check validity period"
-            ]
-        }
-        return tips.get(document, ["Carry all required documents", "Apply in person", "Keep photocopies"])
-    
+        return list(_doc_tips(document))
+
     def _get_common_mistakes(self, document: str) -> List[str]:
         """Get common mistakes to avoid"""
-        mistakes = {
-            "aadhaar_card": [
-                "Not updating address after moving",
-                "Providing wrong mobile number",
-                "Not keeping enrollment ID safe"
-            ],
-            "income_certificate": [
-                "Applying too close to deadline", 
-                "Inconsistent income declarations",
-                "Missing employer signature"
-            ]
-        }
-        return mistakes.get(document, ["Incomplete application", "Missing signatures", "Unclear photocopies"])
-    
+        return list(_doc_mistakes(document))
+
     def _get_submission_locations(self, scheme: Dict[str, Any]) -> List[str]:
         """Get locations for scheme application submission"""
         return [
@@ -663,19 +769,18 @@ You should create comprehensive yet practical plans that empower users to succes
             "Panchayat Office (for rural areas)"
         ]
     
-    def _create_plan_enhancement_prompt(self, scheme: Dict[str, Any], steps: List[ActionStep], situation: Dict[str, Any]) -> str:
-        """Create prompt for LLM plan enhancement"""
-        return f"""Enhance this action plan for the government scheme application:
+    # Fixed preamble compiled once; only the runtime fields get interpolated
+    _enhancement_prompt_template = """Enhance this action plan for the government scheme application:
 
-SCHEME: {scheme["name"]}
-TOTAL STEPS: {len(steps)}
-USER READINESS: {situation.get("user_readiness_score", 0.5):.2f}
-LOCATION TYPE: {situation.get("user_location_type", "unknown")}
+SCHEME: {scheme_name}
+TOTAL STEPS: {total_steps}
+USER READINESS: {user_readiness:.2f}
+LOCATION TYPE: {location_type}
 
 Please provide enhancements in the following areas:
 
 1. TIMELINE: Realistic timeline with phases
-2. MILESTONES: Key checkpoints and deadlines  
+2. MILESTONES: Key checkpoints and deadlines
 3. PREPARATION_CHECKLIST: Things to prepare before starting
 4. CHALLENGES: Potential obstacles user might face
 5. MITIGATION: Strategies to overcome challenges
@@ -688,6 +793,16 @@ Consider:
 - Efficiency improvements to reduce total time
 
 Provide practical, actionable advice that helps users succeed."""
+
+    def _create_plan_enhancement_prompt(self, scheme: Dict[str, Any], step_count: int, situation: Dict[str, Any]) -> str:
+        """Create prompt for LLM plan enhancement"""
+        # format_map skips the kwargs-dict repacking that .format(**kw) incurs
+        return self._enhancement_prompt_template.format_map({
+            "scheme_name": scheme["name"],
+            "total_steps": step_count,
+            "user_readiness": situation.get("user_readiness_score", 0.5),
+            "location_type": situation.get("user_location_type", "unknown")
+        })
     
     def _create_default_enhancements(self, scheme: Dict[str, Any], situation: Dict[str, Any]) -> Dict[str, Any]:
         """Create default enhancements if LLM fails"""
@@ -724,26 +839,30 @@ Provide practical, actionable advice that helps users succeed."""
     
     def _generate_plan_summary(self, plan: ActionPlan) -> str:
         """Generate human-readable plan summary"""
-        summary = f"Action Plan for {plan.scheme_name}\n\n"
-        summary += f"📊 Plan Overview:\n"
-        summary += f"• Total Steps: {plan.total_steps}\n"
-        summary += f"• Estimated Time: {plan.estimated_total_time}\n"
-        summary += f"• Estimated Cost: ₹{plan.estimated_total_cost:,.0f}\n"
-        summary += f"• Success Probability: {plan.success_probability*100:.0f}%\n\n"
-        
-        summary += f"🔥 Critical Steps ({len(plan.critical_steps)}):\n"
+        parts = [
+            f"Action Plan for {plan.scheme_name}",
+            "",
+            "📊 Plan Overview:",
+            f"• Total Steps: {plan.total_steps}",
+            f"• Estimated Time: {plan.estimated_total_time}",
+            f"• Estimated Cost: ₹{plan.estimated_total_cost:,.0f}",
+            f"• Success Probability: {plan.success_probability*100:.0f}%",
+            "",
+            f"🔥 Critical Steps ({len(plan.critical_steps)}):"
+        ]
         for step in plan.critical_steps[:3]:  # Show top 3
-            summary += f"• {step.title}\n"
-        
+            parts.append(f"• {step.title}")
+
         if len(plan.critical_steps) > 3:
-            summary += f"• ... and {len(plan.critical_steps) - 3} more\n"
-        
-        summary += f"\n⏱ Key Milestones:\n"
+            parts.append(f"• ... and {len(plan.critical_steps) - 3} more")
+
+        parts.append("\n⏱ Key Milestones:")
         for milestone in plan.key_milestones[:3]:
-            summary += f"• Week {milestone.get('week')}: {milestone.get('milestone')}\n"
-        
-        summary += f"\n💡 Top Success Tips:\n"
+            parts.append(f"• Week {milestone.get('week')}: {milestone.get('milestone')}")
+
+        parts.append("\n💡 Top Success Tips:")
         for tip in plan.success_tips[:2]:
-            summary += f"• {tip}\n"
-        
-        return summary
\ No newline at end of file
+            parts.append(f"• {tip}")
+
+        parts.append("")
+        return "\n".join(parts)
\ No newline at end of file
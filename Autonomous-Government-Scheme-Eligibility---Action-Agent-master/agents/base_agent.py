@@ -62,6 +62,12 @@ class BaseAgent(ABC):
         
         # Performance tracking
         self.task_history: List[Dict[str, Any]] = []
+
+        # Status generation counter: bumped on every state transition so
+        # get_status can serve a memoized dict while the agent is unchanged
+        # (steady-state polling becomes an int compare)
+        self._status_gen = 0
+        self._status_cache: Optional[tuple] = None
         
         logger.info(f"Initialized agent '{self.name}' with ID: {self.agent_id}")
     
@@ -76,6 +82,7 @@ class BaseAgent(ABC):
                 logger.info(f"Skipping full initialization for {self.name} (quota conservation)")
                 self.state.status = "quota_limited"
                 self.state.last_activity = datetime.now()
+                self._status_gen += 1
                 return True
             
             # Test Gemini connection
@@ -89,16 +96,19 @@ class BaseAgent(ABC):
             
             if test_result:
                 self.state.status = "idle"
+                self._status_gen += 1
                 logger.info(f"Agent {self.name} initialized successfully")
                 return True
             else:
                 self.state.status = "error"
+                self._status_gen += 1
                 logger.error(f"Failed to initialize agent {self.name}")
                 return False
                 
         except Exception as e:
             logger.error(f"Error initializing agent {self.name}: {e}")
             self.state.status = "error"
+            self._status_gen += 1
             return False
     
     @abstractmethod
@@ -116,6 +126,7 @@ class BaseAgent(ABC):
         self.inbox.append(message)
         self.state.last_activity = datetime.now()
         self.state.current_task = message.message_type
+        self._status_gen += 1
         
         try:
             self.state.status = "processing"
@@ -143,6 +154,7 @@ class BaseAgent(ABC):
             self.outbox.append(response)
             self.state.status = "idle"
             self.state.current_task = None
+            self._status_gen += 1
             
             # Update performance metrics
             self._update_performance_metrics(message, response)
@@ -152,6 +164,7 @@ class BaseAgent(ABC):
         except Exception as e:
             logger.error(f"Error handling message in {self.name}: {e}")
             self.state.status = "error"
+            self._status_gen += 1
             
             error_response = AgentMessage(
                 sender=self.agent_id,
@@ -161,7 +174,16 @@ class BaseAgent(ABC):
             )
             self.outbox.append(error_response)
             return error_response
-    
+
+    async def handle_messages(self, messages: List[AgentMessage]) -> List[AgentMessage]:
+        """Handle a batch of messages concurrently.
+
+        The default fans the batch out with asyncio.gather; agents whose
+        backend supports it can override this to serve the whole batch from
+        a single LLM call.
+        """
+        return list(await asyncio.gather(*(self.handle_message(m) for m in messages)))
+
     async def generate_llm_response(
         self,
         prompt: str,
@@ -239,8 +261,12 @@ class BaseAgent(ABC):
         return successful_tasks / len(self.task_history)
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current agent status"""
-        return {
+        """Get current agent status (memoized until the next state change)"""
+        cached = self._status_cache
+        if cached is not None and cached[0] == self._status_gen:
+            return cached[1]
+
+        status = {
             "agent_id": self.agent_id,
             "name": self.name,
             "status": self.state.status,
@@ -250,6 +276,8 @@ class BaseAgent(ABC):
             "capabilities": self.capabilities,
             "queue_size": len(self.inbox)
         }
+        self._status_cache = (self._status_gen, status)
+        return status
     
     def get_health_check(self) -> Dict[str, Any]:
         """Get agent health information"""
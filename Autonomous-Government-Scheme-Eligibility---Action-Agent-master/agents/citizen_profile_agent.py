@@ -5,13 +5,162 @@ Extracts structured citizen data (Student/Farmer) using Gemini
 import json
 import os
 import re
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from loguru import logger
-from google.genai import types
+from pydantic import BaseModel
 
 from agents.base_agent import BaseAgent
 
+
+@dataclass(slots=True)
+class NormalizedProfile:
+    """Compact record produced by _normalize_for_system (slots: no per-instance dict)"""
+    caste_category: str
+    annual_income: float
+    income_category: str
+    is_farmer: bool
+    disability_status: bool
+    gender: str
+    age: int
+    occupation: str
+    employment_status: str
+
+
+class CitizenProfileSchema(BaseModel):
+    """Response schema enforced server-side by Gemini structured output"""
+    name: Optional[str] = None
+    user_type: Optional[str] = None
+    age: Optional[int] = None
+    gender: Optional[str] = None
+    state: Optional[str] = None
+    district: Optional[str] = None
+    income_range: Optional[str] = None
+    category: Optional[str] = None
+    minority: Optional[bool] = None
+    disability: Optional[bool] = None
+    # Student specific
+    education_level: Optional[str] = None
+    course_name: Optional[str] = None
+    stream: Optional[str] = None
+    institution_name: Optional[str] = None
+    institution_type: Optional[str] = None
+    year_of_study: Optional[int] = None
+    previous_year_marks_percent: Optional[float] = None
+    is_hosteller: Optional[bool] = None
+    # Farmer specific
+    owns_land: Optional[bool] = None
+    land_area_acres: Optional[float] = None
+    main_crops: Optional[str] = None
+    irrigation_source: Optional[str] = None
+    has_farmer_id: Optional[bool] = None
+    has_livestock: Optional[bool] = None
+    # Conversational follow-up, produced in the same call as extraction
+    next_question: Optional[str] = None
+
+# Precompiled/constant lookups used by _normalize_for_system (avoids per-call
+# regex compile-cache lookups and dict allocation)
+_INCOME_NUM_RE = re.compile(r"(\d+\.?\d*)")
+_CATEGORY_MAP = {
+    "sc": "sc", "scheduled caste": "sc",
+    "st": "st", "scheduled tribe": "st",
+    "obc": "obc", "other backward class": "obc",
+    "general": "general", "gen": "general"
+}
+
+
+# Income-category thresholds (same as ProfileAnalyzer). The old if-cascade
+# checked <=12000 before <=8000, making 'aay' unreachable; sorted thresholds
+# + bisect fix that and resolve in one C-level call.
+# Note: 200000 is a deliberately high BPL cutoff — schemes often use it.
+_INCOME_THRESHOLDS = (8000, 12000, 200000)
+_INCOME_CATEGORIES = ("aay", "bpl", "bpl", "apl")
+
+
+@lru_cache(maxsize=256)
+def _parse_annual_income(income_range: str) -> float:
+    """Parse an income range string (e.g. '0-2.5L') into a rupee amount.
+
+    Cached — users report income from a small set of ranges, so repeat
+    profiles skip the regex and float work entirely.
+    """
+    annual_income = 100000.0  # Default
+
+    try:
+        # Simple heuristic parsing
+        if "0-2.5" in income_range or "2.5" in income_range:
+            annual_income = 125000.0
+        elif "2.5-5" in income_range:
+            annual_income = 375000.0
+        elif "bpl" in income_range.lower():
+            annual_income = 20000.0
+
+        # If user didn't specify, we might default or try to parse numbers
+        nums = _INCOME_NUM_RE.findall(income_range)
+        if nums:
+            # Assuming Lakhs if small numbers
+            val = float(nums[0])
+            if val < 100:
+                annual_income = val * 100000
+            else:
+                annual_income = val
+    except:
+        pass
+
+    return annual_income
+
+# Expected-field tables, hoisted so they aren't rebuilt per request.
+# Tuples keep question ordering stable.
+_BASE_FIELDS = (
+    "name", "user_type", "age", "gender", "state", "district",
+    "income_range", "category", "minority", "disability"
+)
+_STUDENT_FIELDS = (
+    "education_level", "course_name", "stream", "institution_name",
+    "institution_type", "year_of_study", "previous_year_marks_percent", "is_hosteller"
+)
+_FARMER_FIELDS = (
+    "owns_land", "land_area_acres", "main_crops", "irrigation_source",
+    "has_farmer_id", "has_livestock"
+)
+_EXPECTED_BY_TYPE = {
+    "student": _BASE_FIELDS + _STUDENT_FIELDS,
+    "farmer": _BASE_FIELDS + _FARMER_FIELDS
+}
+
+# Human-friendly phrasings for missing-field questions (avoids a second
+# Gemini round-trip just to word the question)
+_FIELD_PROMPTS = {
+    "name": "your name",
+    "user_type": "whether you are a student or a farmer",
+    "age": "your age",
+    "gender": "your gender",
+    "state": "which state you live in",
+    "district": "your district",
+    "income_range": "your family's annual income range",
+    "category": "your category (SC/ST/OBC/General)",
+    "minority": "whether you belong to a minority community",
+    "disability": "whether you have any disability",
+    "education_level": "your education level",
+    "course_name": "the course you are studying",
+    "stream": "your stream (Science/Arts/Commerce)",
+    "institution_name": "the name of your institution",
+    "institution_type": "whether your institution is government or private",
+    "year_of_study": "your year of study",
+    "previous_year_marks_percent": "your previous year's marks percentage",
+    "is_hosteller": "whether you stay in a hostel",
+    "owns_land": "whether you own farmland",
+    "land_area_acres": "how many acres of land you farm",
+    "main_crops": "the main crops you grow",
+    "irrigation_source": "your irrigation source",
+    "has_farmer_id": "whether you have a farmer ID",
+    "has_livestock": "whether you keep livestock"
+}
+
 # Define the system prompt based on user requirements
 SYSTEM_PROMPT = """
 You are a highly efficient "Citizen Data Extraction Agent." Your sole purpose is to listen to user descriptions and extract key demographic and socioeconomic variables into a structured JSON format.
@@ -51,6 +200,7 @@ You are a highly efficient "Citizen Data Extraction Agent." Your sole purpose is
 2. If a value is missing for the identified type, set it to null.
 3. Do NOT extract student fields for farmers, and vice versa.
 4. Output ONLY valid JSON.
+5. Additionally include a 'next_question' field that politely asks the user for up to 3 missing fields; set it to null if the profile is complete.
 """
 
 class CitizenProfileAgent(BaseAgent):
@@ -70,6 +220,42 @@ class CitizenProfileAgent(BaseAgent):
                 "identify_user_type"
             ]
         )
+        # Server-side prompt cache: upload SYSTEM_PROMPT once and reference
+        # it by name so its tokens aren't re-sent (or re-billed) per request
+        self._prompt_cache_name = None
+        self._prompt_cache_expires = 0.0
+        self._prompt_cache_disabled = False
+
+    def _get_prompt_cache(self):
+        """Return the cached-content name, (re)creating it on expiry.
+
+        Returns None (and stops retrying) if the API doesn't support
+        context caching for this model/key — callers fall back to sending
+        system_instruction inline.
+        """
+        if self._prompt_cache_disabled:
+            return None
+        now = time.monotonic()
+        if self._prompt_cache_name and now < self._prompt_cache_expires:
+            return self._prompt_cache_name
+        try:
+            from google.genai import types
+            cache = self.llm_client.client.caches.create(
+                model=self.llm_client.config.model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=SYSTEM_PROMPT,
+                    ttl="3600s"
+                )
+            )
+            self._prompt_cache_name = cache.name
+            # Refresh a minute before the server-side TTL lapses
+            self._prompt_cache_expires = now + 3540.0
+            return self._prompt_cache_name
+        except Exception as e:
+            logger.warning(f"Context caching unavailable, sending prompt inline: {e}")
+            self._prompt_cache_disabled = True
+            return None
+
     
     def get_system_prompt(self) -> str:
         return SYSTEM_PROMPT
@@ -88,27 +274,34 @@ class CitizenProfileAgent(BaseAgent):
                 full_input += f"\nContext from previous: {json.dumps(existing_profile)}"
             
             # Use the LLM to extract data
+            # (deferred import keeps cold start cheap when the agent is
+            # constructed but never called; cached by Python after first use)
+            from google.genai import types
+
+            cache_name = self._get_prompt_cache()
+
             try:
                 response = self.llm_client.client.models.generate_content(
                     model=self.llm_client.config.model_name,
                     contents=full_input,
                     config=types.GenerateContentConfig(
-                        system_instruction=SYSTEM_PROMPT,
+                        cached_content=cache_name,
+                        system_instruction=None if cache_name else SYSTEM_PROMPT,
                         temperature=0.1,
                         top_p=0.95,
                         top_k=64,
                         max_output_tokens=8192,
-                        response_mime_type="application/json"
+                        response_mime_type="application/json",
+                        response_schema=CitizenProfileSchema
                     )
                 )
-                data = json.loads(response.text)
-                
-                # Handle case where LLM returns a list instead of a dict
-                if isinstance(data, list):
-                    if len(data) > 0:
-                        data = data[0]
-                    else:
-                        data = {}
+                # Schema enforcement guarantees a dict with every key present
+                # (nulled if missing), so no list-unwrap or key-backfill needed
+                parsed = response.parsed
+                if parsed is not None:
+                    data = parsed.model_dump()
+                else:
+                    data = json.loads(response.text)
             except Exception as e:
                 error_str = str(e)
                 logger.error(f"Gemini API Error: {error_str}")
@@ -132,44 +325,20 @@ class CitizenProfileAgent(BaseAgent):
             # Post-processing (similar to the user's script)
             if "missing_fields" in data:
                 del data["missing_fields"]
-                
-            # Define base expected fields
-            base_fields = [
-                "name", "user_type", "age", "gender", "state", "district", 
-                "income_range", "category", "minority", "disability"
-            ]
-            
-            # Define type-specific fields
-            student_fields = [
-                "education_level", "course_name", "stream", "institution_name",
-                "institution_type", "year_of_study", "previous_year_marks_percent", "is_hosteller"
-            ]
-            
-            farmer_fields = [
-                "owns_land", "land_area_acres", "main_crops", "irrigation_source",
-                "has_farmer_id", "has_livestock"
-            ]
 
-            expected_fields = list(base_fields)
-
-            # Determine user_type to expand expected fields
+            # The extraction call also phrases the follow-up question, so no
+            # second round-trip is needed for it
+            llm_question = data.pop("next_question", None)
+                
+            # Determine user_type to expand expected fields; unknown types
+            # minimally expect the base fields + type clarification
             user_type = data.get("user_type")
-            
-            if user_type == "student":
-                expected_fields.extend(student_fields)
-            elif user_type == "farmer":
-                expected_fields.extend(farmer_fields)
-            else:
-                # If unknown type, we minimally expect the base fields + type clarification
-                pass
+            expected_fields = _EXPECTED_BY_TYPE.get(user_type, _BASE_FIELDS)
 
-            # Ensure all expected keys exist in data, set to None if missing
-            for field in expected_fields:
-                if field not in data:
-                    data[field] = None
-
-            # Identify missing fields (for UI feedback)
-            missing_fields = [k for k, v in data.items() if v is None and k in expected_fields]
+            # Identify missing fields (for UI feedback) — iterate the expected
+            # tuple directly: O(|expected|) with O(1) dict lookups, and the
+            # question order follows the field table
+            missing_fields = [k for k in expected_fields if data.get(k) is None]
             
             # Calculate Completion Percentage
             total_fields = len(expected_fields)
@@ -182,38 +351,28 @@ class CitizenProfileAgent(BaseAgent):
                 if not user_type:
                     next_question = "Could you please tell me if you are a Student or a Farmer?"
                 else:
-                    # Generate a natural question for missing fields
-                    # We'll ask for top 3 missing fields to avoid overwhelming the user
-                    priority_missing = missing_fields[:3]
-                    question_prompt = f"""
-                    You are a helpful government scheme assistant.
-                    The user is a {user_type}.
-                    We need the following details to complete their profile: {', '.join(priority_missing)}.
-                    Draft a polite, conversational question to ask the user for this information.
-                    Keep it short and encouraging.
-                    """
-                    try:
-                        q_response = self.llm_client.client.models.generate_content(
-                            model=self.llm_client.config.model_name,
-                            contents=question_prompt,
-                            config=types.GenerateContentConfig(
-                                temperature=0.7,
-                                max_output_tokens=100
-                            )
+                    # Prefer the question phrased by the extraction call itself;
+                    # template one locally otherwise. Either way, no extra
+                    # round-trip just to word the question.
+                    if llm_question:
+                        next_question = llm_question
+                    else:
+                        priority_missing = missing_fields[:3]
+                        asks = ", ".join(
+                            _FIELD_PROMPTS.get(f, f.replace("_", " ")) for f in priority_missing
                         )
-                        next_question = q_response.text.strip()
-                    except Exception as e:
-                        logger.warning(f"Failed to generate question: {e}")
-                        next_question = f"Please provide your {', '.join(priority_missing).replace('_', ' ')}."
+                        next_question = f"Could you share {asks}?"
             else:
                 next_question = "Your profile is complete! We can now find the best schemes for you."
 
             # Normalize for system compatibility (SchemeDiscoveryAgent)
             normalized_profile = self._normalize_for_system(data)
             
-            # Merge normalized data with raw data
+            # Merge normalized data with raw data (dict only at this
+            # serialization edge; the record itself is slots-based)
             # We keep the raw data structure but ensure key fields for other agents are present
-            final_profile = {**normalized_profile, **data}
+            final_profile = asdict(normalized_profile)
+            final_profile.update(data)
             
             return {
                 "success": True,
@@ -233,83 +392,48 @@ class CitizenProfileAgent(BaseAgent):
                 "profile": None
             }
 
-    def _normalize_for_system(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _normalize_for_system(self, data: Dict[str, Any]) -> NormalizedProfile:
         """Normalize extracted data for compatibility with other agents"""
-        normalized = {}
-        
-        # Normalize category -> caste_category
-        category_map = {
-            "sc": "sc", "scheduled caste": "sc",
-            "st": "st", "scheduled tribe": "st",
-            "obc": "obc", "other backward class": "obc",
-            "general": "general", "gen": "general"
-        }
-        raw_cat = str(data.get("category", "")).lower()
-        normalized["caste_category"] = category_map.get(raw_cat, "general")
-        
+        # Normalize category -> caste_category. Fast path: skip the
+        # str()+lower() allocations when the value is already canonical.
+        raw_cat = data.get("category")
+        if raw_cat in _CATEGORY_MAP:
+            caste_category = _CATEGORY_MAP[raw_cat]
+        else:
+            caste_category = _CATEGORY_MAP.get(str(raw_cat or "").lower(), "general")
+
         # Normalize income
         # income_range is e.g. "0-2.5L"
         # We need annual_income (float) and income_category (bpl/apl)
-        income_range = str(data.get("income_range", ""))
-        annual_income = 100000.0 # Default
-        
-        try:
-            # Simple heuristic parsing
-            if "0-2.5" in income_range or "2.5" in income_range:
-                annual_income = 125000.0
-            elif "2.5-5" in income_range:
-                annual_income = 375000.0
-            elif "bpl" in income_range.lower():
-                annual_income = 20000.0
-            
-            # If user didn't specify, we might default or try to parse numbers
-            nums = re.findall(r"(\d+\.?\d*)", income_range)
-            if nums:
-                # Assuming Lakhs if small numbers
-                val = float(nums[0])
-                if val < 100: 
-                    annual_income = val * 100000
-                else:
-                    annual_income = val
-        except:
-            pass
-            
-        normalized["annual_income"] = annual_income
-        
-        # Income category logic (same as ProfileAnalyzer)
-        if annual_income <= 12000:
-            normalized["income_category"] = "bpl" # Very low
-        elif annual_income <= 8000:
-             normalized["income_category"] = "aay"
-        elif annual_income <= 200000:
-            normalized["income_category"] = "bpl" # Using higher threshold for BPL mapping effectively for schemes often
-        else:
-            normalized["income_category"] = "apl"
-            
-        # Is Farmer
-        normalized["is_farmer"] = (data.get("user_type") == "farmer")
-        
-        # Disability
-        normalized["disability_status"] = bool(data.get("disability"))
-        
-        # Gender
-        normalized["gender"] = str(data.get("gender", "male")).lower() # Default male if missing
-        
+        annual_income = _parse_annual_income(str(data.get("income_range", "")))
+
         # Age
         try:
-            normalized["age"] = int(data.get("age", 30))
+            age = int(data.get("age", 30))
         except:
-            normalized["age"] = 30
-            
+            age = 30
+
         # Occupation
-        if data.get("user_type") == "farmer":
-            normalized["occupation"] = "Farmer"
-            normalized["employment_status"] = "self_employed"
-        elif data.get("user_type") == "student":
-            normalized["occupation"] = "Student"
-            normalized["employment_status"] = "student"
+        user_type = data.get("user_type")
+        if user_type == "farmer":
+            occupation, employment_status = "Farmer", "self_employed"
+        elif user_type == "student":
+            occupation, employment_status = "Student", "student"
         else:
-            normalized["occupation"] = "Unknown"
-            normalized["employment_status"] = "unemployed"
-            
-        return normalized
\ No newline at end of file
+            occupation, employment_status = "Unknown", "unemployed"
+
+        return NormalizedProfile(
+            caste_category=caste_category,
+            annual_income=annual_income,
+            # Income category via threshold table (bisect_left keeps the
+            # inclusive-upper-bound semantics of the old cascade)
+            income_category=_INCOME_CATEGORIES[
+                bisect_left(_INCOME_THRESHOLDS, annual_income)
+            ],
+            is_farmer=(user_type == "farmer"),
+            disability_status=bool(data.get("disability")),
+            gender=str(data.get("gender", "male")).lower(),  # Default male if missing
+            age=age,
+            occupation=occupation,
+            employment_status=employment_status
+        )
\ No newline at end of file
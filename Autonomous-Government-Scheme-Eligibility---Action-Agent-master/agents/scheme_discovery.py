@@ -3,6 +3,7 @@ Scheme Discovery Agent
 Finds potentially applicable government schemes based on user profile
 """
 import json
+from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple
 from pydantic import BaseModel, Field
 from loguru import logger
@@ -11,6 +12,27 @@ from agents.base_agent import BaseAgent
 from data.schemes_db import GOVERNMENT_SCHEMES
 
 
+@dataclass(slots=True)
+class _ScoringFeatures:
+    """Profile values the relevance scorer reads, extracted once per batch.
+
+    Scoring runs over every scheme in the catalog; pulling and normalizing
+    these fields per scheme repeated the same dict lookups and .lower()
+    calls hundreds of times for one request.
+    """
+    user_type: str
+    income_category: Any
+    caste_category: str
+    age: int
+    gender: str
+    occupation: str
+    is_farmer: bool
+    employment_status: Any
+    disability_status: Any
+    is_pregnant_lactating: Any
+    is_woman_head: Any
+
+
 class SchemeMatch(BaseModel):
     """Represents a matched scheme with relevance score"""
     scheme_id: str
@@ -250,17 +272,34 @@ You should provide detailed reasoning for each scheme match and exclude clearly
     
     async def _score_scheme_relevance(self, profile: Dict[str, Any], schemes: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], float]]:
         """Score relevance of each scheme for the user"""
-        scored_schemes = []
-        
-        for scheme in schemes:
-            score = self._calculate_relevance_score(profile, scheme)
-            scored_schemes.append((scheme, score))
+        features = self._extract_scoring_features(profile)
+        scored_schemes = [
+            (scheme, self._calculate_relevance_score(features, scheme))
+            for scheme in schemes
+        ]
         
         # Sort by relevance score (highest first)
         scored_schemes.sort(key=lambda x: x[1], reverse=True)
         return scored_schemes
     
-    def _calculate_relevance_score(self, profile: Dict[str, Any], scheme: Dict[str, Any]) -> float:
+    @staticmethod
+    def _extract_scoring_features(profile: Dict[str, Any]) -> _ScoringFeatures:
+        """Normalize the profile fields the scorer uses, once per batch"""
+        return _ScoringFeatures(
+            user_type=profile.get("user_type", "").lower(),
+            income_category=profile.get("income_category"),
+            caste_category=profile.get("caste_category", ""),
+            age=profile.get("age", 0),
+            gender=profile.get("gender", ""),
+            occupation=profile.get("occupation", "").lower(),
+            is_farmer=bool(profile.get("is_farmer", False)),
+            employment_status=profile.get("employment_status"),
+            disability_status=profile.get("disability_status"),
+            is_pregnant_lactating=profile.get("is_pregnant_lactating"),
+            is_woman_head=profile.get("is_woman_head"),
+        )
+    
+    def _calculate_relevance_score(self, features: _ScoringFeatures, scheme: Dict[str, Any]) -> float:
         """Calculate relevance score for a scheme"""
         score = 0.0
         max_score = 0.0
@@ -274,7 +313,7 @@ You should provide detailed reasoning for each scheme match and exclude clearly
             score = 0.5 # Base score
             
             # Boost if category/audience matches user type
-            user_type = profile.get("user_type", "").lower()
+            user_type = features.user_type
             scheme_target = scheme.get("target_audience", "").lower()
             
             if user_type == "student" and "student" in scheme_target:
@@ -288,7 +327,7 @@ You should provide detailed reasoning for each scheme match and exclude clearly
         # Income category match (high weight)
         max_score += 0.25
         if "income_category" in criteria:
-            user_income_cat = profile.get("income_category")
+            user_income_cat = features.income_category
             if user_income_cat in criteria["income_category"]:
                 if user_income_cat == "bpl":
                     score += 0.25  # BPL gets full points
@@ -300,16 +339,16 @@ You should provide detailed reasoning for each scheme match and exclude clearly
         # Social category match (medium weight)
         max_score += 0.2
         target_groups = scheme.get("target_groups", [])
-        user_caste = profile.get("caste_category", "")
-        if user_caste in ["sc", "st", "obc"] and any(cat in target_groups for cat in ["sc_students", "st_welfare"]):
+        user_caste = features.caste_category
+        if user_caste in ("sc", "st", "obc") and any(cat in target_groups for cat in ("sc_students", "st_welfare")):
             score += 0.2
         elif "general" in target_groups:
             score += 0.1
         
         # Demographics match (medium weight)
         max_score += 0.2
-        user_age = profile.get("age", 0)
-        user_gender = profile.get("gender", "")
+        user_age = features.age
+        user_gender = features.gender
         
         # Age-specific schemes
         if user_age >= 60 and "senior_citizens" in target_groups:
@@ -325,23 +364,23 @@ You should provide detailed reasoning for each scheme match and exclude clearly
         
         # Occupation match (medium weight)  
         max_score += 0.15
-        user_occupation = profile.get("occupation", "").lower()
+        user_occupation = features.occupation
         scheme_category = scheme.get("category", "").lower()
         
         if "farmer" in user_occupation and "agriculture" in scheme_category:
             score += 0.15
-        elif profile.get("is_farmer", False) and "agriculture" in scheme_category:
+        elif features.is_farmer and "agriculture" in scheme_category:
             score += 0.15
-        elif "employment" in scheme_category and profile.get("employment_status") == "unemployed":
+        elif "employment" in scheme_category and features.employment_status == "unemployed":
             score += 0.12
         
         # Special circumstances (high weight)
         max_score += 0.2
-        if profile.get("disability_status") and "disability" in scheme_category:
+        if features.disability_status and "disability" in scheme_category:
             score += 0.2
-        if profile.get("is_pregnant_lactating") and "maternal" in scheme_category:
+        if features.is_pregnant_lactating and "maternal" in scheme_category:
             score += 0.2
-        if profile.get("is_woman_head") and "women" in target_groups:
+        if features.is_woman_head and "women" in target_groups:
             score += 0.15
         
         # Normalize score
@@ -4,6 +4,7 @@ Handles local model connections and API calls
 """
 import os
 import asyncio
+import time
 from typing import Dict, Any, List, Optional
 import ollama
 from loguru import logger
@@ -24,12 +25,17 @@ class OllamaClient:
     
     def __init__(self, config: OllamaConfig = None):
         self.config = config or OllamaConfig()
-        self.client = ollama.Client(host=self.config.base_url)
+        self.client = ollama.AsyncClient(host=self.config.base_url)
+        # Memoized availability check (models don't vanish between calls);
+        # re-verified after _verify_ttl seconds
+        self._model_verified = False
+        self._verified_at = 0.0
+        self._verify_ttl = 600.0
         
     async def check_model_availability(self) -> bool:
         """Check if the specified model is available"""
         try:
-            models = self.client.list()
+            models = await self.client.list()
             available_models = [model['name'] for model in models.get('models', [])]
             return self.config.model in available_models
         except Exception as e:
@@ -39,10 +45,14 @@ class OllamaClient:
     async def pull_model_if_needed(self) -> bool:
         """Pull the model if it's not available locally"""
         try:
+            if self._model_verified and (time.monotonic() - self._verified_at) < self._verify_ttl:
+                return True
             if not await self.check_model_availability():
                 logger.info(f"Pulling model {self.config.model}...")
-                self.client.pull(self.config.model)
+                await self.client.pull(self.config.model)
                 logger.info(f"Model {self.config.model} pulled successfully")
+            self._model_verified = True
+            self._verified_at = time.monotonic()
             return True
         except Exception as e:
             logger.error(f"Error pulling model: {e}")
@@ -65,7 +75,7 @@ class OllamaClient:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
             
-            response = self.client.chat(
+            response = await self.client.chat(
                 model=self.config.model,
                 messages=messages,
                 options={
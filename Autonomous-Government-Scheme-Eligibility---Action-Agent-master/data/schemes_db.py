@@ -2,29 +2,56 @@
 Government Schemes Database Loader
 Loads scheme data from schemes.json
 """
-import json
 import os
 from loguru import logger
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Memoized parse keyed on (path, mtime) so repeated loads skip the JSON decode
+_cache = {}
+
 def load_schemes():
-    """Load schemes from schemes.json file"""
+    """Load schemes from schemes.json file (memoized on file mtime)"""
     try:
         # Look in root directory then data directory
         paths = ["schemes.json", "data/schemes.json"]
-        
+
         for path in paths:
             if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    schemes = json.load(f)
-                    logger.info(f"Loaded {len(schemes)} schemes from {path}")
-                    return schemes
-        
+                key = (path, os.path.getmtime(path))
+                if key in _cache:
+                    return _cache[key]
+                with open(path, "rb") as f:
+                    schemes = _json.loads(f.read())
+                logger.info(f"Loaded {len(schemes)} schemes from {path}")
+                _cache.clear()
+                _cache[key] = schemes
+                return schemes
+
         logger.warning("schemes.json not found in expected locations")
         return []
-        
+
     except Exception as e:
         logger.error(f"Error loading schemes.json: {e}")
         return []
 
+def get_schemes():
+    """Accessor for the scheme catalog (cached after first load)"""
+    return load_schemes()
+
+def iter_schemes():
+    """Iterate schemes lazily — lets filtering consumers avoid copying the list"""
+    yield from load_schemes()
+
 # Export the schemes list
 GOVERNMENT_SCHEMES = load_schemes()
+
+# O(1) lookup by scheme_id, built once per process and shared by all agents
+SCHEME_INDEX = {s["scheme_id"]: s for s in GOVERNMENT_SCHEMES}
+
+def get_scheme_by_id(scheme_id):
+    """Look up a scheme by its id (dict hit instead of a list scan)"""
+    return SCHEME_INDEX.get(scheme_id)
@@ -1,10 +1,41 @@
 import sqlite3
 import os
+import hmac
+import threading
 from typing import Optional, Dict, Any
 
+import bcrypt
+
 # Ensure DB_PATH is absolute and relative to this script file
 DB_PATH = os.path.join(os.path.dirname(__file__), "users.db")
 
+# Optional site-wide pepper mixed into every hash (set PASSWORD_PEPPER in env)
+_PEPPER = os.getenv("PASSWORD_PEPPER", "").encode()
+
+def _hash_password(password: str) -> bytes:
+    return bcrypt.hashpw(password.encode() + _PEPPER, bcrypt.gensalt(12))
+
+def _check_password(password: str, password_hash: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode() + _PEPPER, password_hash)
+    except (ValueError, TypeError):
+        return False
+
+# One long-lived connection per thread: avoids paying file-open + schema
+# parse on every query, and WAL lets readers run alongside the writer
+_local = threading.local()
+
+def _conn() -> sqlite3.Connection:
+    """Get (or lazily open) this thread's connection."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    return conn
+
 def init_user_db():
     """Initialize the users database with the required table and ensure schema is up to date."""
     # Ensure the directory exists
@@ -32,7 +63,8 @@ def init_user_db():
             "occupation": "TEXT DEFAULT ''",
             "annual_income": "TEXT DEFAULT ''",
             "education_level": "TEXT DEFAULT ''",
-            "caste_category": "TEXT DEFAULT ''"
+            "caste_category": "TEXT DEFAULT ''",
+            "password_hash": "BLOB"
         }
         
         # Get existing columns
@@ -46,20 +78,26 @@ def init_user_db():
                     cursor.execute(f"ALTER TABLE users ADD COLUMN {col} {col_def}")
                 except Exception as e:
                     print(f"Error adding column {col}: {e}")
-                    
+
+        # The UNIQUE constraint on email already materializes an index; drop
+        # the duplicate one older databases carry so inserts maintain one
+        # B-tree, not two
+        cursor.execute("DROP INDEX IF EXISTS idx_users_email")
+
+
         conn.commit()
 
 def create_user(name, email, phone, password) -> bool:
     """Create a new user. Returns True if successful, False if email exists."""
     try:
-        with sqlite3.connect(DB_PATH, timeout=10) as conn:  # Added timeout
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO users (name, email, phone, password) VALUES (?, ?, ?, ?)",
-                (name, email, phone, password)
-            )
-            conn.commit()
-            return True
+        conn = _conn()
+        # Plaintext column stays empty; only the bcrypt digest is stored
+        conn.execute(
+            "INSERT INTO users (name, email, phone, password, password_hash) VALUES (?, ?, ?, ?, ?)",
+            (name, email, phone, "", _hash_password(password))
+        )
+        conn.commit()
+        return True
     except sqlite3.IntegrityError:
         return False
     except Exception as e:
@@ -69,17 +107,45 @@ def create_user(name, email, phone, password) -> bool:
 def verify_user(email, password) -> Optional[Dict[str, Any]]:
     """Verify user credentials. Returns user dict if valid, None otherwise."""
     try:
-        with sqlite3.connect(DB_PATH, timeout=10) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Select all columns to be safe, or specify carefully
-            cursor.execute("SELECT * FROM users WHERE email = ? AND password = ?", (email, password))
-            row = cursor.fetchone()
-            
-            if row:
-                return dict(row)
+        # Index seek on email returning one narrow row; use
+        # get_user_profile for the full row.
+        conn = _conn()
+        cursor = conn.execute(
+            "SELECT id, name, email, phone, password, password_hash FROM users WHERE email = ?",
+            (email,)
+        )
+        row = cursor.fetchone()
+        if not row:
             return None
+
+        if row["password_hash"] is not None:
+            valid = _check_password(password, row["password_hash"])
+        else:
+            # Legacy plaintext row: constant-time compare, then upgrade the
+            # stored credential in place on success
+            valid = hmac.compare_digest(str(row["password"]), str(password))
+            if valid:
+                conn.execute(
+                    "UPDATE users SET password_hash = ?, password = '' WHERE id = ?",
+                    (_hash_password(password), row["id"])
+                )
+                conn.commit()
+
+        if valid:
+            user = dict(row)
+            del user["password"]
+            del user["password_hash"]
+            return user
+        return None
     except Exception as e:
         print(f"Error verifying user: {e}")
         return None
+
+def get_user_profile(user_id) -> Optional[Dict[str, Any]]:
+    """Fetch the full user row by id (for profile views, not login)."""
+    try:
+        row = _conn().execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
+        return dict(row) if row else None
+    except Exception as e:
+        print(f"Error fetching user profile: {e}")
+        return None
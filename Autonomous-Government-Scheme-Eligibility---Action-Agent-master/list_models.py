@@ -1,25 +1,25 @@
 import os
-import asyncio
+import sys
 from google import genai
 from dotenv import load_dotenv
 
 load_dotenv()
 
-async def list_models():
+def main():
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         print("No API Key found")
         return
 
     client = genai.Client(api_key=api_key)
-    
+
     print("Listing available models...")
     try:
-        # Just print the model object or name to see what's available
-        for model in client.models.list():
-            print(f"- {model.name}")
+        # Collect first, then emit one write instead of a flush per model
+        names = [model.name for model in client.models.list()]
+        sys.stdout.write("\n".join(f"- {name}" for name in names) + "\n")
     except Exception as e:
         print(f"Error listing models: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(list_models())
\ No newline at end of file
+    main()
@@ -70,12 +70,30 @@ async def quick_start():
 async def uvicorn_serve(app):
     """Serve with uvicorn"""
     import uvicorn
-    config = uvicorn.Config(app, host="127.0.0.1", port=8000, log_level="warning")
+    try:
+        # uvloop + httptools (bundled with uvicorn[standard]) give the faster
+        # event loop and HTTP parser; fall back to the pure-Python defaults
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        config = uvicorn.Config(app, host="127.0.0.1", port=8000,
+                                log_level="warning", loop="uvloop", http="httptools",
+                                backlog=2048, limit_concurrency=1000,
+                                timeout_keep_alive=30, access_log=False)
+    except ImportError:
+        config = uvicorn.Config(app, host="127.0.0.1", port=8000,
+                                log_level="warning", loop="asyncio",
+                                backlog=2048, limit_concurrency=1000,
+                                timeout_keep_alive=30, access_log=False)
     server = uvicorn.Server(config)
     await server.serve()
 
 if __name__ == "__main__":
     try:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         asyncio.run(quick_start())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
@@ -3,9 +3,37 @@ Global System Tools
 Shared tools and utilities used across all agents in the system
 """
 import json
+import atexit
+import queue
 import sqlite3
+import threading
 import uuid
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """JSON-encode via orjson's C serializer (hot write paths)"""
+        return orjson.dumps(obj, default=str).decode()
+
+    def _dumps_bytes(obj) -> bytes:
+        """JSON-encode straight to bytes, skipping the UTF-8 decode/encode
+        round-trip for columns that are only ever read back by _loads"""
+        return orjson.dumps(obj, default=str)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    def _dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+    _loads = json.loads
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -13,17 +41,23 @@ from loguru import logger
 import os
 
 
-class DecisionLog(BaseModel):
-    """Individual decision log entry"""
-    log_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = Field(default_factory=datetime.now)
-    agent_id: str
+@dataclass(slots=True, kw_only=True)
+class DecisionLog:
+    """Individual decision log entry.
+
+    A slotted dataclass rather than a pydantic model: entries are created
+    once per request on the hot path and only ever read back by our own
+    code, so per-instance __dict__ and validation overhead buy nothing.
+    """
+    log_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    timestamp: datetime = field(default_factory=datetime.now)
+    agent_id: str = ""
     user_id: Optional[str] = None
-    decision_type: str
-    input_data: Dict[str, Any]
-    output_data: Dict[str, Any]
-    reasoning: str
-    confidence_score: float = Field(ge=0.0, le=1.0)
+    decision_type: str = ""
+    input_data: Dict[str, Any] = field(default_factory=dict)
+    output_data: Dict[str, Any] = field(default_factory=dict)
+    reasoning: str = ""
+    confidence_score: float = 0.0
     execution_time_ms: float = 0.0
     success: bool = True
     error_message: Optional[str] = None
@@ -40,27 +74,156 @@ class UserState(BaseModel):
     progress_history: List[Dict[str, Any]] = Field(default_factory=list)
 
 
+
+# Decision-log insert, shared by the buffered flusher and the batch path
+_INSERT_LOG_SQL = """
+    INSERT INTO decision_logs (
+        log_id, timestamp, agent_id, user_id, decision_type,
+        input_data, output_data, reasoning, confidence_score,
+        execution_time_ms, success, error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Module-level query strings: identical objects per call means sqlite3's
+# statement cache hits on identity and skips re-parsing
+_SELECT_USER_LOGS_SQL = """
+    SELECT * FROM decision_logs 
+    WHERE user_id = ? 
+    ORDER BY timestamp DESC 
+    LIMIT ?
+"""
+_UPSERT_USER_STATE_SQL = """
+    INSERT OR REPLACE INTO user_states (
+        user_id, profile, active_plans, completed_plans,
+        last_activity, preferences, progress_history
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_USER_STATE_SQL = "SELECT * FROM user_states WHERE user_id = ?"
+_LIST_USER_LOGS_SQL = """
+    SELECT log_id, timestamp, agent_id, decision_type, confidence_score, success
+    FROM decision_logs
+    WHERE user_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+_SELECT_LOG_SQL = "SELECT * FROM decision_logs WHERE log_id = ?"
+
+# Buffered log_decision flush cadence
+_FLUSH_INTERVAL_S = 0.1
+_FLUSH_BATCH = 128
+
+
+def _column_type(conn: sqlite3.Connection, table: str, column: str) -> Optional[str]:
+    """Declared type of a column, or None if the table/column is missing"""
+    for row in conn.execute(f"PRAGMA table_info({table})"):
+        if row[1] == column:
+            return (row[2] or "").upper()
+    return None
+
+
+def _apply_performance_pragmas(conn: sqlite3.Connection):
+    """Put a freshly opened database into WAL mode with relaxed syncing.
+
+    WAL persists in the file, so running this once at init covers later
+    connections; the remaining pragmas are per-connection hints.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-64000")
+
+
+class _SqliteConnectionPool:
+    """One persistent writer plus a small pool of read-only connections.
+
+    SQLite allows exactly one writer at a time, so writes funnel through a
+    single locked connection; reads borrow from the pool. Keeping
+    connections open avoids the per-call open/close (and the .db/-wal/-shm
+    syscalls behind it) the stores used to pay on every operation.
+    """
+
+    def __init__(self, db_path: str, readers: int = 4):
+        # cached_statements lets sqlite3 reuse parsed plans for the repeated
+        # INSERT/SELECT strings instead of re-preparing them per call
+        self._writer = sqlite3.connect(db_path, check_same_thread=False,
+                                       cached_statements=256)
+        _apply_performance_pragmas(self._writer)
+        self._writer_lock = threading.Lock()
+
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(readers):
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True,
+                                   check_same_thread=False,
+                                   cached_statements=256)
+            # Read-only connections can't flip journal modes; just the
+            # per-connection tuning applies
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-64000")
+            self._readers.put(conn)
+
+    @contextmanager
+    def write(self):
+        """Borrow the writer; commits on success, rolls back on error"""
+        with self._writer_lock:
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._writer.rollback()
+                raise
+
+    @contextmanager
+    def read(self):
+        """Borrow a read-only connection from the pool"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+
 class AgentDecisionLogger:
     """Logs all agent decisions for transparency and debugging"""
     
     def __init__(self, db_path: str = "./data/decisions.db"):
         self.db_path = db_path
+        # Callers check this before assembling log payloads, so a disabled
+        # logger costs nothing on the request path
+        self.enabled = True
         self._ensure_database()
+        self._pool = _SqliteConnectionPool(self.db_path)
+
+        # log_decision buffers rows here; a daemon thread flushes them every
+        # 100 ms (or at 128 rows) in a single transaction, so callers pay a
+        # list append instead of a commit
+        self._buffer: List[tuple] = []
+        self._buf_lock = threading.Lock()
+        self._buf_event = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, daemon=True, name="decision-log-flusher"
+        )
+        self._flusher.start()
+        atexit.register(self.flush)
     
     def _ensure_database(self):
         """Ensure decision log database exists"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         with sqlite3.connect(self.db_path) as conn:
+            _apply_performance_pragmas(conn)
+            # Timestamps are INTEGER epoch microseconds: native B-tree
+            # comparisons and index range scans, no TEXT casting
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS decision_logs (
                     log_id TEXT PRIMARY KEY,
-                    timestamp TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     agent_id TEXT NOT NULL,
                     user_id TEXT,
                     decision_type TEXT NOT NULL,
-                    input_data TEXT NOT NULL,
-                    output_data TEXT NOT NULL,
+                    input_data BLOB NOT NULL,
+                    output_data BLOB NOT NULL,
                     reasoning TEXT NOT NULL,
                     confidence_score REAL NOT NULL,
                     execution_time_ms REAL NOT NULL,
@@ -68,59 +231,139 @@ class AgentDecisionLogger:
                     error_message TEXT
                 )
             """)
+            self._migrate_text_timestamps(conn)
+            # Composite indexes matching the two read patterns: per-user
+            # listing (ORDER BY timestamp DESC) and per-agent stats over a
+            # recent time window — both become index range scans
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_log_user_ts
+                ON decision_logs(user_id, timestamp DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_log_agent_ts
+                ON decision_logs(agent_id, timestamp DESC)
+            """)
             conn.commit()
+
+    @staticmethod
+    def _migrate_text_timestamps(conn: sqlite3.Connection):
+        """One-time rebuild of databases created with ISO-string timestamps"""
+        if _column_type(conn, "decision_logs", "timestamp") != "TEXT":
+            return
+        logger.info("Migrating decision_logs timestamps to epoch microseconds")
+        conn.execute("DROP INDEX IF EXISTS idx_log_user_ts")
+        conn.execute("DROP INDEX IF EXISTS idx_log_agent_ts")
+        conn.execute("ALTER TABLE decision_logs RENAME TO decision_logs_old")
+        conn.execute("""
+            CREATE TABLE decision_logs (
+                log_id TEXT PRIMARY KEY,
+                timestamp INTEGER NOT NULL,
+                agent_id TEXT NOT NULL,
+                user_id TEXT,
+                decision_type TEXT NOT NULL,
+                input_data BLOB NOT NULL,
+                output_data BLOB NOT NULL,
+                reasoning TEXT NOT NULL,
+                confidence_score REAL NOT NULL,
+                execution_time_ms REAL NOT NULL,
+                success BOOLEAN NOT NULL,
+                error_message TEXT
+            )
+        """)
+        conn.execute("""
+            INSERT INTO decision_logs
+            SELECT log_id,
+                   CAST(strftime('%s', timestamp) AS INTEGER) * 1000000,
+                   agent_id, user_id, decision_type, input_data, output_data,
+                   reasoning, confidence_score, execution_time_ms, success,
+                   error_message
+            FROM decision_logs_old
+        """)
+        conn.execute("DROP TABLE decision_logs_old")
     
+    @staticmethod
+    def _row(decision: DecisionLog) -> tuple:
+        """Serialize a DecisionLog into its insert parameter tuple"""
+        return (
+            decision.log_id,
+            int(decision.timestamp.timestamp() * 1_000_000),
+            decision.agent_id,
+            decision.user_id,
+            decision.decision_type,
+            _dumps_bytes(decision.input_data),
+            _dumps_bytes(decision.output_data),
+            decision.reasoning,
+            decision.confidence_score,
+            decision.execution_time_ms,
+            decision.success,
+            decision.error_message
+        )
+
     def log_decision(self, decision: DecisionLog) -> bool:
-        """Log a decision to the database"""
+        """Log a decision (buffered; the flusher thread writes it out)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO decision_logs (
-                        log_id, timestamp, agent_id, user_id, decision_type,
-                        input_data, output_data, reasoning, confidence_score,
-                        execution_time_ms, success, error_message
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    decision.log_id,
-                    decision.timestamp.isoformat(),
-                    decision.agent_id,
-                    decision.user_id,
-                    decision.decision_type,
-                    json.dumps(decision.input_data),
-                    json.dumps(decision.output_data),
-                    decision.reasoning,
-                    decision.confidence_score,
-                    decision.execution_time_ms,
-                    decision.success,
-                    decision.error_message
-                ))
-                conn.commit()
-            return True
+            row = self._row(decision)
         except Exception as e:
-            logger.error(f"Error logging decision: {e}")
+            logger.error("Error logging decision: {}", e)
             return False
+
+        with self._buf_lock:
+            self._buffer.append(row)
+            if len(self._buffer) >= _FLUSH_BATCH:
+                self._buf_event.set()
+        return True
+
+    def _flush_loop(self):
+        """Daemon loop: flush the buffer on a timer or when it fills up"""
+        while True:
+            self._buf_event.wait(_FLUSH_INTERVAL_S)
+            self._buf_event.clear()
+            self.flush()
+
+    def flush(self):
+        """Write all buffered decisions in one transaction"""
+        with self._buf_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+        try:
+            with self._pool.write() as conn:
+                conn.executemany(_INSERT_LOG_SQL, batch)
+        except Exception as e:
+            logger.error("Error flushing decision buffer: {}", e)
     
+    def log_decisions_batch(self, decisions: List[DecisionLog]) -> bool:
+        """Log several decisions in a single transaction.
+
+        Used by the orchestrator's background log consumer so a batch costs
+        one connection and one commit instead of one per decision.
+        """
+        if not decisions:
+            return True
+        try:
+            with self._pool.write() as conn:
+                conn.executemany(_INSERT_LOG_SQL, [self._row(d) for d in decisions])
+            return True
+        except Exception as e:
+            logger.error("Error logging decision batch: {}", e)
+            return False
+
     def get_decisions_by_user(self, user_id: str, limit: int = 100) -> List[DecisionLog]:
         """Get recent decisions for a user"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM decision_logs 
-                    WHERE user_id = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT ?
-                """, (user_id, limit))
+            with self._pool.read() as conn:
+                cursor = conn.execute(_SELECT_USER_LOGS_SQL, (user_id, limit))
                 
                 decisions = []
                 for row in cursor.fetchall():
                     decision = DecisionLog(
                         log_id=row[0],
-                        timestamp=datetime.fromisoformat(row[1]),
+                        timestamp=datetime.fromtimestamp(row[1] / 1e6),
                         agent_id=row[2],
                         user_id=row[3],
                         decision_type=row[4],
-                        input_data=json.loads(row[5]),
-                        output_data=json.loads(row[6]),
+                        input_data=_loads(row[5]),
+                        output_data=_loads(row[6]),
                         reasoning=row[7],
                         confidence_score=row[8],
                         execution_time_ms=row[9],
@@ -131,26 +374,78 @@ class AgentDecisionLogger:
                 
                 return decisions
         except Exception as e:
-            logger.error(f"Error retrieving decisions: {e}")
+            logger.error("Error retrieving decisions: {}", e)
             return []
+
+    def list_decisions_by_user(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """List lightweight decision summaries for a user.
+
+        Skips the input/output payload columns entirely — no blob transfer,
+        no JSON decode — for callers that only render a history listing.
+        Fetch a single full entry with get_decision when it is opened.
+        """
+        try:
+            with self._pool.read() as conn:
+                cursor = conn.execute(_LIST_USER_LOGS_SQL, (user_id, limit))
+                return [
+                    {
+                        "log_id": row[0],
+                        "timestamp": datetime.fromtimestamp(row[1] / 1e6),
+                        "agent_id": row[2],
+                        "decision_type": row[3],
+                        "confidence_score": row[4],
+                        "success": bool(row[5])
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except Exception as e:
+            logger.error("Error listing decisions: {}", e)
+            return []
+
+    def get_decision(self, log_id: str) -> Optional[DecisionLog]:
+        """Fetch one decision with its full payloads by log id"""
+        try:
+            with self._pool.read() as conn:
+                row = conn.execute(_SELECT_LOG_SQL, (log_id,)).fetchone()
+            if row is None:
+                return None
+            return DecisionLog(
+                log_id=row[0],
+                timestamp=datetime.fromtimestamp(row[1] / 1e6),
+                agent_id=row[2],
+                user_id=row[3],
+                decision_type=row[4],
+                input_data=_loads(row[5]),
+                output_data=_loads(row[6]),
+                reasoning=row[7],
+                confidence_score=row[8],
+                execution_time_ms=row[9],
+                success=bool(row[10]),
+                error_message=row[11]
+            )
+        except Exception as e:
+            logger.error("Error retrieving decision: {}", e)
+            return None
     
     def get_agent_performance_stats(self, agent_id: str, days: int = 30) -> Dict[str, Any]:
         """Get performance statistics for an agent"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._pool.read() as conn:
                 # Calculate date threshold
-                from_date = (datetime.now() - datetime.timedelta(days=days)).isoformat()
+                from_ts = int((datetime.now() - timedelta(days=days)).timestamp() * 1_000_000)
                 
                 # Get basic stats
+                # success is stored as 0/1, so SUM() counts the successes
+                # without a per-row CASE branch
                 cursor = conn.execute("""
                     SELECT 
                         COUNT(*) as total_decisions,
                         AVG(confidence_score) as avg_confidence,
                         AVG(execution_time_ms) as avg_execution_time,
-                        COUNT(CASE WHEN success = 1 THEN 1 END) as successful_decisions
+                        SUM(success) as successful_decisions
                     FROM decision_logs 
                     WHERE agent_id = ? AND timestamp > ?
-                """, (agent_id, from_date))
+                """, (agent_id, from_ts))
                 
                 row = cursor.fetchone()
                 if row:
@@ -167,7 +462,7 @@ class AgentDecisionLogger:
                     return {"agent_id": agent_id, "total_decisions": 0}
                     
         except Exception as e:
-            logger.error(f"Error getting agent stats: {e}")
+            logger.error("Error getting agent stats: {}", e)
             return {"error": str(e)}
 
 
@@ -177,105 +472,213 @@ class UserStateStore:
     def __init__(self, db_path: str = "./data/user_states.db"):
         self.db_path = db_path
         self._ensure_database()
+        self._pool = _SqliteConnectionPool(self.db_path)
     
     def _ensure_database(self):
         """Ensure user state database exists"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         with sqlite3.connect(self.db_path) as conn:
+            _apply_performance_pragmas(conn)
+            # WITHOUT ROWID: every access is a user_id point lookup, so one
+            # B-tree keyed by user_id beats rowid storage plus a PK index
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS user_states (
-                    user_id TEXT PRIMARY KEY,
+                    user_id TEXT PRIMARY KEY NOT NULL,
                     profile TEXT NOT NULL,
                     active_plans TEXT NOT NULL,
                     completed_plans TEXT NOT NULL,
-                    last_activity TEXT NOT NULL,
+                    last_activity INTEGER NOT NULL,
                     preferences TEXT NOT NULL,
                     progress_history TEXT NOT NULL
-                )
+                ) WITHOUT ROWID
             """)
+            self._migrate_user_states(conn)
             conn.commit()
+
+    @staticmethod
+    def _migrate_user_states(conn: sqlite3.Connection):
+        """One-time rebuild of databases created with the old layout.
+
+        Handles both legacy traits together: ISO-string last_activity (needs
+        INTEGER affinity, not just converted values) and the default rowid
+        table (WITHOUT ROWID can only be set at creation).
+        """
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='user_states'"
+        ).fetchone()
+        text_ts = _column_type(conn, "user_states", "last_activity") == "TEXT"
+        has_rowid = table_sql is not None and "WITHOUT ROWID" not in table_sql[0].upper()
+        if not (text_ts or has_rowid):
+            return
+
+        logger.info("Migrating user_states to WITHOUT ROWID / epoch timestamps")
+        ts_expr = (
+            "CAST(strftime('%s', last_activity) AS INTEGER) * 1000000"
+            if text_ts else "last_activity"
+        )
+        conn.execute("ALTER TABLE user_states RENAME TO user_states_old")
+        conn.execute("""
+            CREATE TABLE user_states (
+                user_id TEXT PRIMARY KEY NOT NULL,
+                profile TEXT NOT NULL,
+                active_plans TEXT NOT NULL,
+                completed_plans TEXT NOT NULL,
+                last_activity INTEGER NOT NULL,
+                preferences TEXT NOT NULL,
+                progress_history TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute(f"""
+            INSERT INTO user_states
+            SELECT user_id, profile, active_plans, completed_plans,
+                   {ts_expr},
+                   preferences, progress_history
+            FROM user_states_old
+        """)
+        conn.execute("DROP TABLE user_states_old")
     
     def save_user_state(self, user_state: UserState) -> bool:
         """Save user state to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO user_states (
-                        user_id, profile, active_plans, completed_plans,
-                        last_activity, preferences, progress_history
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            with self._pool.write() as conn:
+                conn.execute(_UPSERT_USER_STATE_SQL, (
                     user_state.user_id,
-                    json.dumps(user_state.profile),
-                    json.dumps(user_state.active_plans),
-                    json.dumps(user_state.completed_plans),
-                    user_state.last_activity.isoformat(),
-                    json.dumps(user_state.preferences),
-                    json.dumps(user_state.progress_history)
+                    _dumps(user_state.profile),
+                    _dumps(user_state.active_plans),
+                    _dumps(user_state.completed_plans),
+                    int(user_state.last_activity.timestamp() * 1_000_000),
+                    _dumps(user_state.preferences),
+                    _dumps(user_state.progress_history)
                 ))
-                conn.commit()
             return True
         except Exception as e:
-            logger.error(f"Error saving user state: {e}")
+            logger.error("Error saving user state: {}", e)
             return False
     
-    def get_user_state(self, user_id: str) -> Optional[UserState]:
-        """Get user state from database"""
+    def get_user_state(self, user_id: str, create_if_missing: bool = True) -> Optional[UserState]:
+        """Get user state from database.
+
+        With create_if_missing (the default) an absent user gets a fresh
+        state persisted immediately. Mutators pass False so a first touch
+        costs one write — theirs — instead of a create here plus an upsert.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM user_states WHERE user_id = ?
-                """, (user_id,))
+            with self._pool.read() as conn:
+                cursor = conn.execute(_SELECT_USER_STATE_SQL, (user_id,))
                 
                 row = cursor.fetchone()
                 if row:
                     return UserState(
                         user_id=row[0],
-                        profile=json.loads(row[1]),
-                        active_plans=json.loads(row[2]),
-                        completed_plans=json.loads(row[3]),
-                        last_activity=datetime.fromisoformat(row[4]),
-                        preferences=json.loads(row[5]),
-                        progress_history=json.loads(row[6])
+                        profile=_loads(row[1]),
+                        active_plans=_loads(row[2]),
+                        completed_plans=_loads(row[3]),
+                        last_activity=datetime.fromtimestamp(row[4] / 1e6),
+                        preferences=_loads(row[5]),
+                        progress_history=_loads(row[6])
                     )
-                else:
-                    # Create new user state
-                    new_state = UserState(user_id=user_id)
-                    self.save_user_state(new_state)
-                    return new_state
+                if not create_if_missing:
+                    return None
+                # Create new user state
+                new_state = UserState(user_id=user_id)
+                self.save_user_state(new_state)
+                return new_state
                     
         except Exception as e:
-            logger.error(f"Error getting user state: {e}")
+            logger.error("Error getting user state: {}", e)
             return None
     
+    @staticmethod
+    def _now_us() -> int:
+        return int(datetime.now().timestamp() * 1_000_000)
+
     def update_user_profile(self, user_id: str, profile_updates: Dict[str, Any]) -> bool:
-        """Update user profile data"""
-        user_state = self.get_user_state(user_id)
-        if user_state:
-            user_state.profile.update(profile_updates)
-            user_state.last_activity = datetime.now()
-            return self.save_user_state(user_state)
-        return False
+        """Update user profile data (rewrites only the profile column)"""
+        try:
+            with self._pool.read() as conn:
+                row = conn.execute(
+                    "SELECT profile FROM user_states WHERE user_id = ?", (user_id,)
+                ).fetchone()
+
+            if row is None:
+                # First touch: build the state in memory and write it once
+                user_state = self.get_user_state(user_id, create_if_missing=False) \
+                    or UserState(user_id=user_id)
+                user_state.profile.update(profile_updates)
+                user_state.last_activity = datetime.now()
+                return self.save_user_state(user_state)
+
+            profile = _loads(row[0])
+            profile.update(profile_updates)
+            with self._pool.write() as conn:
+                conn.execute(
+                    "UPDATE user_states SET profile = ?, last_activity = ? WHERE user_id = ?",
+                    (_dumps(profile), self._now_us(), user_id)
+                )
+            return True
+        except Exception as e:
+            logger.error("Error updating user profile: {}", e)
+            return False
     
     def add_active_plan(self, user_id: str, plan_id: str) -> bool:
-        """Add a new active plan for user"""
-        user_state = self.get_user_state(user_id)
-        if user_state and plan_id not in user_state.active_plans:
-            user_state.active_plans.append(plan_id)
-            user_state.last_activity = datetime.now()
-            return self.save_user_state(user_state)
-        return False
+        """Add a new active plan for user.
+
+        A single JSON1 UPDATE appends in place, guarded so a plan already in
+        the array leaves the row untouched — no decode/encode of the other
+        columns.
+        """
+        try:
+            with self._pool.write() as conn:
+                cursor = conn.execute("""
+                    UPDATE user_states
+                    SET active_plans = json_insert(active_plans, '$[#]', ?),
+                        last_activity = ?
+                    WHERE user_id = ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM json_each(user_states.active_plans)
+                          WHERE value = ?
+                      )
+                """, (plan_id, self._now_us(), user_id, plan_id))
+            if cursor.rowcount > 0:
+                return True
+
+            # No row yet: build the state with the plan included and write
+            # it once
+            user_state = self.get_user_state(user_id, create_if_missing=False) \
+                or UserState(user_id=user_id)
+            if plan_id not in user_state.active_plans:
+                user_state.active_plans.append(plan_id)
+                user_state.last_activity = datetime.now()
+                return self.save_user_state(user_state)
+            return False
+        except Exception as e:
+            logger.error("Error adding active plan: {}", e)
+            return False
     
     def complete_plan(self, user_id: str, plan_id: str) -> bool:
-        """Move plan from active to completed"""
-        user_state = self.get_user_state(user_id)
-        if user_state and plan_id in user_state.active_plans:
-            user_state.active_plans.remove(plan_id)
-            user_state.completed_plans.append(plan_id)
-            user_state.last_activity = datetime.now()
-            return self.save_user_state(user_state)
-        return False
+        """Move plan from active to completed (single in-place UPDATE)"""
+        try:
+            with self._pool.write() as conn:
+                cursor = conn.execute("""
+                    UPDATE user_states
+                    SET active_plans = (
+                            SELECT json_group_array(value)
+                            FROM json_each(user_states.active_plans)
+                            WHERE value != ?
+                        ),
+                        completed_plans = json_insert(completed_plans, '$[#]', ?),
+                        last_activity = ?
+                    WHERE user_id = ?
+                      AND EXISTS (
+                          SELECT 1 FROM json_each(user_states.active_plans)
+                          WHERE value = ?
+                      )
+                """, (plan_id, plan_id, self._now_us(), user_id, plan_id))
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error("Error completing plan: {}", e)
+            return False
 
 
 class SchemeRuleEngine:
@@ -283,25 +686,25 @@ class SchemeRuleEngine:
     
     def __init__(self):
         self.rule_cache = {}
+        # Bound-method dispatch: rule lookup is a single dict hit instead of
+        # an if/elif chain over string comparisons
+        self._dispatch = {
+            "age_range": self._evaluate_age_range,
+            "income_limit": self._evaluate_income_limit,
+            "caste_category": self._evaluate_caste_category,
+            "geographic_eligibility": self._evaluate_geographic_eligibility,
+            "document_availability": self._evaluate_document_availability,
+        }
     
     def evaluate_rule(self, rule_name: str, user_data: Dict[str, Any], rule_parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate a specific eligibility rule"""
+        handler = self._dispatch.get(rule_name)
+        if handler is None:
+            return {"passed": False, "reason": f"Unknown rule: {rule_name}"}
         try:
-            if rule_name == "age_range":
-                return self._evaluate_age_range(user_data, rule_parameters)
-            elif rule_name == "income_limit":
-                return self._evaluate_income_limit(user_data, rule_parameters)
-            elif rule_name == "caste_category":
-                return self._evaluate_caste_category(user_data, rule_parameters)
-            elif rule_name == "geographic_eligibility":
-                return self._evaluate_geographic_eligibility(user_data, rule_parameters)
-            elif rule_name == "document_availability":
-                return self._evaluate_document_availability(user_data, rule_parameters)
-            else:
-                return {"passed": False, "reason": f"Unknown rule: {rule_name}"}
-                
+            return handler(user_data, rule_parameters)
         except Exception as e:
-            logger.error(f"Error evaluating rule {rule_name}: {e}")
+            logger.error("Error evaluating rule {}: {}", rule_name, e)
             return {"passed": False, "reason": f"Rule evaluation error: {str(e)}"}
     
     def _evaluate_age_range(self, user_data: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -367,13 +770,27 @@ class SchemeRuleEngine:
                 "confidence": 1.0
             }
     
+    def _lowered_set(self, cache_key: str, values: List[str]) -> frozenset:
+        """Memoized lowercase frozenset of a rule parameter list.
+
+        Scheme rule parameters are static, so the per-call list comprehension
+        and linear membership scan collapse to one dict hit and one O(1)
+        set lookup after the first evaluation.
+        """
+        key = (cache_key, tuple(values))
+        cached = self.rule_cache.get(key)
+        if cached is None:
+            cached = frozenset(v.lower() for v in values)
+            self.rule_cache[key] = cached
+        return cached
+
     def _evaluate_geographic_eligibility(self, user_data: Dict[str, Any], parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate geographic eligibility"""
         user_state = user_data.get("state", "unknown").lower()
         user_area_type = user_data.get("rural_urban", "unknown").lower()
         
-        allowed_states = [s.lower() for s in parameters.get("allowed_states", [])]
-        allowed_area_types = [t.lower() for t in parameters.get("allowed_area_types", [])]
+        allowed_states = self._lowered_set("states", parameters.get("allowed_states", []))
+        allowed_area_types = self._lowered_set("area_types", parameters.get("allowed_area_types", []))
         
         # Check state eligibility
         if allowed_states and user_state not in allowed_states:
@@ -428,39 +845,51 @@ class SchemeRuleEngine:
             }
 
 
+@lru_cache(maxsize=1024)
+def _render_eligibility_explanation(overall_status: str,
+                                    passed: tuple,
+                                    failed: tuple) -> str:
+    """Build the eligibility explanation text (memoized by its inputs)"""
+    if overall_status == "eligible":
+        parts = ["✅ **You are eligible for this scheme!**\n\n",
+                 "**Why you qualify:**\n"]
+        parts.extend(f"• {reason}\n" for reason in passed)
+    elif overall_status == "not_eligible":
+        parts = ["❌ **You are not currently eligible for this scheme.**\n\n",
+                 "**Reasons for ineligibility:**\n"]
+        parts.extend(f"• {reason}\n" for reason in failed)
+    elif overall_status == "conditionally_eligible":
+        parts = ["⚠️ **You may be eligible with some conditions.**\n\n",
+                 "**What you need to do:**\n"]
+        parts.extend(f"• {reason}\n" for reason in failed[:2])
+    else:
+        parts = ["ℹ️ **Need more information to determine eligibility.**\n\n",
+                 "Please provide complete details about your situation."]
+    return "".join(parts)
+
+
 class HumanReadableExplainer:
     """Converts technical decisions into human-readable explanations"""
     
     @staticmethod
     def explain_eligibility_decision(decision_data: Dict[str, Any]) -> str:
-        """Create human-readable eligibility explanation"""
+        """Create human-readable eligibility explanation.
+
+        The rendered text depends only on the overall status and the rule
+        reasoning strings, so those are extracted into hashable tuples and
+        the rendering itself is memoized — identical decisions (the common
+        case for cached eligibility results) reuse the built string.
+        """
         overall_status = decision_data.get("overall_status", "unknown")
-        passed_rules = decision_data.get("passed_rules", [])
-        failed_rules = decision_data.get("failed_rules", [])
-        
-        if overall_status == "eligible":
-            explanation = "✅ **You are eligible for this scheme!**\n\n"
-            explanation += "**Why you qualify:**\n"
-            for rule in passed_rules[:3]:
-                explanation += f"• {rule.get('reasoning', 'Requirement met')}\n"
-        
-        elif overall_status == "not_eligible":
-            explanation = "❌ **You are not currently eligible for this scheme.**\n\n"
-            explanation += "**Reasons for ineligibility:**\n"
-            for rule in failed_rules[:3]:
-                explanation += f"• {rule.get('reasoning', 'Requirement not met')}\n"
-        
-        elif overall_status == "conditionally_eligible":
-            explanation = "⚠️ **You may be eligible with some conditions.**\n\n"
-            explanation += "**What you need to do:**\n"
-            for rule in failed_rules[:2]:
-                explanation += f"• {rule.get('reasoning', 'Additional requirement')}\n"
-        
-        else:
-            explanation = "ℹ️ **Need more information to determine eligibility.**\n\n"
-            explanation += "Please provide complete details about your situation."
-        
-        return explanation
+        passed = tuple(
+            rule.get("reasoning", "Requirement met")
+            for rule in decision_data.get("passed_rules", [])[:3]
+        )
+        failed = tuple(
+            rule.get("reasoning", "Requirement not met")
+            for rule in decision_data.get("failed_rules", [])[:3]
+        )
+        return _render_eligibility_explanation(overall_status, passed, failed)
     
     @staticmethod
     def explain_action_plan(plan_data: Dict[str, Any]) -> str:
@@ -469,32 +898,34 @@ class HumanReadableExplainer:
         total_steps = plan_data.get("total_steps", 0)
         estimated_time = plan_data.get("estimated_total_time", "several weeks")
         
-        explanation = f"📋 **Action Plan for {plan_name}**\n\n"
-        explanation += f"**Overview:** {total_steps} steps, estimated {estimated_time}\n\n"
+        parts = [
+            f"📋 **Action Plan for {plan_name}**\n\n",
+            f"**Overview:** {total_steps} steps, estimated {estimated_time}\n\n",
+        ]
         
         # Critical steps
         critical_steps = plan_data.get("critical_steps", [])
         if critical_steps:
-            explanation += "🔴 **Critical Steps (Must Complete):**\n"
+            parts.append("🔴 **Critical Steps (Must Complete):**\n")
             for i, step in enumerate(critical_steps[:3], 1):
-                explanation += f"{i}. {step.get('title', 'Important step')}\n"
+                parts.append(f"{i}. {step.get('title', 'Important step')}\n")
             if len(critical_steps) > 3:
-                explanation += f"... and {len(critical_steps) - 3} more critical steps\n"
-            explanation += "\n"
+                parts.append(f"... and {len(critical_steps) - 3} more critical steps\n")
+            parts.append("\n")
         
         # Timeline
         timeline = plan_data.get("suggested_timeline", "")
         if timeline:
-            explanation += f"⏰ **Timeline:** {timeline}\n\n"
+            parts.append(f"⏰ **Timeline:** {timeline}\n\n")
         
         # Success tips
         success_tips = plan_data.get("success_tips", [])
         if success_tips:
-            explanation += "💡 **Success Tips:**\n"
+            parts.append("💡 **Success Tips:**\n")
             for tip in success_tips[:2]:
-                explanation += f"• {tip}\n"
+                parts.append(f"• {tip}\n")
         
-        return explanation
+        return "".join(parts)
 
 
 class SafeFailureHandler:
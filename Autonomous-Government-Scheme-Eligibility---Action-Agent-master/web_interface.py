@@ -14,7 +14,7 @@ import os
 from datetime import datetime
 from dotenv import load_dotenv # Import load_dotenv
 
-from main import get_government_scheme_agent, UserRequest
+from main import get_government_scheme_agent, UserRequest, USER_REQUEST_ADAPTER
 from data.users_db import init_user_db, create_user, verify_user
 from typing import List, Dict, Optional, Any
 from abc import ABC, abstractmethod
@@ -391,7 +391,7 @@ async def health_check():
     """Health check endpoint with quota awareness"""
     try:
         if agent_system:
-            status = agent_system.get_system_status()
+            status = await agent_system.get_system_status()
             
             # Add quota information
             quota_info = {
@@ -445,12 +445,12 @@ async def health_check():
 async def analyze_profile(request: ProfileAnalysisRequest):
     """Analyze user profile for scheme eligibility"""
     try:
-        user_request = UserRequest(
-            user_id=request.user_id or f"user_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            request_type="update_profile",
-            user_input=request.user_input,
-            existing_profile=request.existing_profile
-        )
+        user_request = USER_REQUEST_ADAPTER.validate_python({
+            "user_id": request.user_id or f"user_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "request_type": "update_profile",
+            "user_input": request.user_input,
+            "existing_profile": request.existing_profile
+        })
         
         response = await agent_system.process_user_request(user_request)
         
@@ -477,13 +477,13 @@ class SchemeDiscoveryRequest(BaseModel):
 async def get_eligible_schemes(request: SchemeDiscoveryRequest):
     """Find eligible schemes for an existing user profile"""
     try:
-        user_request = UserRequest(
-            user_id=request.user_id,
-            request_type="discover_schemes",
-            user_input="", # No new input, just re-evaluate
-            existing_profile=request.profile,
-            options=request.options
-        )
+        user_request = USER_REQUEST_ADAPTER.validate_python({
+            "user_id": request.user_id,
+            "request_type": "discover_schemes",
+            "user_input": "",  # No new input, just re-evaluate
+            "existing_profile": request.profile,
+            "options": request.options
+        })
         
         response = await agent_system.process_user_request(user_request)
         
@@ -508,12 +508,12 @@ async def get_eligible_schemes(request: SchemeDiscoveryRequest):
 async def apply_for_schemes(request: SchemeApplicationRequest):
     """Find schemes and create application plan"""
     try:
-        user_request = UserRequest(
-            user_id=request.user_id or f"user_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            request_type="new_application",
-            user_input=request.user_input,
-            options=request.options
-        )
+        user_request = USER_REQUEST_ADAPTER.validate_python({
+            "user_id": request.user_id or f"user_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "request_type": "new_application",
+            "user_input": request.user_input,
+            "options": request.options
+        })
         
         response = await agent_system.process_user_request(user_request)
         
@@ -538,12 +538,12 @@ async def apply_for_schemes(request: SchemeApplicationRequest):
 async def follow_up_application(request: FollowUpRequest):
     """Follow up on existing application"""
     try:
-        user_request = UserRequest(
-            user_id=request.user_id,
-            request_type="follow_up",
-            user_input=request.update_message,
-            options=request.options
-        )
+        user_request = USER_REQUEST_ADAPTER.validate_python({
+            "user_id": request.user_id,
+            "request_type": "follow_up",
+            "user_input": request.update_message,
+            "options": request.options
+        })
         
         response = await agent_system.process_user_request(user_request)
         
@@ -565,7 +565,7 @@ async def get_system_status():
     """Get detailed system status"""
     try:
         if agent_system:
-            status = agent_system.get_system_status()
+            status = await agent_system.get_system_status()
             return status
         else:
             raise HTTPException(status_code=503, detail="Agent system not available")